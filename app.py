@@ -1,11 +1,18 @@
 import asyncio
+import atexit
+import datetime
 import hashlib
 import hmac
+import json
 import time
 import os
 import concurrent.futures
+import shlex
 import shutil
+import tempfile
+from pathlib import Path, PurePath
 import threading
+from collections import OrderedDict
 from threading import Thread
 import logging
 from flask import (
@@ -18,9 +25,11 @@ from flask import (
     session,
     jsonify,
     send_from_directory,
+    stream_template,
     abort,
     current_app,
 )
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO
 from flask_login import (
     LoginManager,
@@ -30,8 +39,12 @@ from flask_login import (
     logout_user,
 )
 from flask_wtf.csrf import CSRFProtect
+from werkzeug.exceptions import NotFound
+from jinja2 import FileSystemBytecodeCache
 from dotenv import load_dotenv
 import schedule
+from sqlalchemy.exc import IntegrityError
+import orjson
 
 from sqlalchemy_sqlite import (
     CrudDB,
@@ -50,8 +63,10 @@ from zplatipld_ingest import duration_ingest, zplatipld_ingest
 load_dotenv()
 
 logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
-THREAD_WORKERS = 60
+MAX_CONCURRENT_DEPLOYS = 60
+PROGRESS_EMIT_INTERVAL = 0.25
 global TASK_STOP_RUNNING
 RESULT_PATH = "/zplatipld/database"
 ZPLATIPLD_DB = "zplatipld.sqlite3"
@@ -62,16 +77,115 @@ ZPLATIPLD_RESULTS_FAIL_TABLE = "results_fail"
 ZPLATIPLD_RESULTS_GARB_TABLE = "results_garb"
 PRIVATE_FILE_PATH = "/zplatipld/secret"
 ROOT_RESULTS = "/zplatipld/results"
+SAFE_RESULTS_PATH = Path(ROOT_RESULTS).resolve()
+# Same filesystem as ROOT_RESULTS (renames must stay atomic) but outside it,
+# so ingest and the file browser never see partial downloads
+ROOT_RESULTS_STAGING = "/zplatipld/results.staging"
+# mkdtemp creates 0700 dirs; published results dirs get the usual mode
+RESULTS_DIR_MODE = 0o755
+# Result files are replaced on every deploy: have browsers revalidate (a
+# cheap 304 while unchanged) rather than trust a cached copy
+RESULTS_DOWNLOAD_MAX_AGE = 0
 ROOT_TMP_ANALYSIS = "/tmp/ipl_analysis/"
+# Recreates an empty analysis directory on the LPAR, {d} must be shell-quoted
+TMP_ANALYSIS_RESET_CMD = "rm -rf {d}; mkdir -p {d}; ls -la {d}"
+# Local dir and the analysis scripts uploaded to each LPAR by deploy_loop
+LOCAL_DIR = os.path.dirname(os.path.abspath(__file__))
+DEPLOY_SCRIPTS = tuple(
+    os.path.join(LOCAL_DIR, script_name)
+    for script_name in (
+        "ipld_calc.awk",
+        "ipld_parsing.awk",
+        "patterns",
+        "main.sh",
+        "methods.sh",
+    )
+)
 IPL_DB_LPAR = "ipld_db_lpar.db"
 IPL_DB_USER = "ipld_db_user.db"
 
+# schedule.every() attribute for each accepted day_of_week (None = daily)
+SCHEDULE_DAY_ATTRS = {
+    None: "day",
+    "sunday": "sunday",
+    "monday": "monday",
+    "tuesday": "tuesday",
+    "wednesday": "wednesday",
+    "thursday": "thursday",
+    "friday": "friday",
+    "saturday": "saturday",
+}
+
 # HTML Constants
+JINJA_CACHE_DIR = "/tmp/ipld_jinja_cache"
+JINJA_CACHE_SIZE = 1000
+PEOPLE_BATCH_SIZE = 500
+# Result pages show every column of these tables, taken from the models so
+# the selected keys can't drift from the schema
+RESULTS_DONE_COLUMNS = tuple(ResultsDoneTable.__table__.columns)
+RESULTS_FAIL_COLUMNS = tuple(ResultsFailTable.__table__.columns)
+# Tables accepted by the database import page, keyed by the submitted name
+IMPORT_TABLES = {"lpar": Lpar, "vault": Vault}
 LOGIN_HTML = "login.html"
 VAULT_SSH_HTML = "vault_ssh.html"
 LPAR_SETTINGS_HTML = "lpar_settings.html"
 LPAR_SETTINGS_DET_HTML = "lpar_settings_detail.html"
 
+# Process-wide database handles shared by every request and worker thread.
+# Writers are serialized on a single connection that takes the SQLite write
+# lock up front; readers get their own read-only pool.
+WRITE_DB = CrudDB(
+    ZPLATIPLD_URL_DB, pool_size=1, max_overflow=0, txlock="IMMEDIATE"
+)
+READ_DB = CrudDB(ZPLATIPLD_URL_DB, readonly=True, pool_size=os.cpu_count())
+
+# Fast verifier cache: after a successful PBKDF2 check, remember an HMAC of
+# the plaintext (under a per-process key) for the stored hash so repeated
+# logins skip the 100k PBKDF2 rounds until the entry expires.
+FAST_VERIFIER_TTL = 15 * 60
+FAST_VERIFIER_MAX_ENTRIES = 1024
+_FAST_VERIFIER_KEY = os.urandom(32)
+_FAST_VERIFIER = OrderedDict()
+_FAST_VERIFIER_LOCK = threading.Lock()
+
+# Password hashing relies on the OpenSSL-backed hashlib: pbkdf2_hmac and
+# scrypt are only as fast as the linked libcrypto, so deploy against
+# OpenSSL >= 1.1.1 built with SHA extensions (SHA-NI) enabled.
+SCRYPT_PREFIX = "scrypt$"
+SCRYPT_PARAMS = {"n": 2**14, "r": 8, "p": 1, "maxmem": 64 * 1024 * 1024}
+if "sha256" not in hashlib.algorithms_guaranteed or not hasattr(
+    hashlib, "scrypt"
+):
+    raise RuntimeError(
+        "hashlib must be linked against OpenSSL 1.1.1+ (sha256 and scrypt)"
+    )
+
+# Salts are sliced from a urandom buffer refilled 4 KiB at a time, one
+# getrandom() per 256 salts. Forked children drop the inherited buffer so
+# no two processes hand out the same bytes.
+SALT_SIZE = 16
+SALT_BUFFER_SIZE = 4096
+_SALT_BUFFER = bytearray()
+_SALT_LOCK = threading.Lock()
+os.register_at_fork(after_in_child=_SALT_BUFFER.clear)
+
+
+def _new_salt():
+    with _SALT_LOCK:
+        if len(_SALT_BUFFER) < SALT_SIZE:
+            _SALT_BUFFER.extend(os.urandom(SALT_BUFFER_SIZE))
+        salt = bytes(_SALT_BUFFER[:SALT_SIZE])
+        del _SALT_BUFFER[:SALT_SIZE]
+    return salt
+
+
+# Worker threads for the CPU-bound password key derivations, one per core.
+# hashlib.scrypt and pbkdf2_hmac release the GIL, so they run in parallel
+# without forking this multi-threaded process
+PWD_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="pwd"
+)
+
 
 def generate_password_hash(
     password,
@@ -82,39 +196,90 @@ def generate_password_hash(
     This method is used to generate a password hash
     Parameters:
     - password (str): Plaintext password to hash
-    - method (str): Algorithm that will use for build the hash
+    - method (str): Algorithm that will use for build the hash, "scrypt" or
+      a PBKDF2 digest name such as "sha256"
 
     Returns (str): hexadecimal hash of password
 
     """
     if salt is None:
-        salt = os.urandom(16)
+        salt = _new_salt()
+    if method == "scrypt":
+        key = hashlib.scrypt(password.encode("utf-8"), salt=salt, **SCRYPT_PARAMS)
+        return SCRYPT_PREFIX + (salt + key).hex()
     key = hashlib.pbkdf2_hmac(method, password.encode("utf-8"), salt, 100000)
     generated_password = salt + key
     return generated_password.hex()
 
 
-def check_password_hash(plain_password, hashed_password, method):
+def _verify_password_key(plain_password, hashed_password, method):
     """
-    This method is used to generate a password hash
+    Recompute the key of a stored hash and compare it, run inside PWD_POOL
     Parameters:
-    - plain_password (str): Plaintext password to hash
+    - plain_password (str): Plaintext password to check
     - hashed_password (str): Hexadecimal hash of password
-    - method (str): Algorithm that will use for decode the hash
+    - method (str): PBKDF2 digest name, ignored for scrypt hashes
 
     Returns (bool): True or False
 
     """
-    hashed_password_hex = bytes.fromhex(hashed_password)
-    salt = hashed_password_hex[:16]
-    stored_key = hashed_password_hex[16:]
-    new_key = hashlib.pbkdf2_hmac(
-        method, plain_password.encode("utf-8"), salt, 100000
-    )
+    if hashed_password.startswith(SCRYPT_PREFIX):
+        hashed_password_hex = bytes.fromhex(hashed_password[len(SCRYPT_PREFIX):])
+        salt = hashed_password_hex[:16]
+        stored_key = hashed_password_hex[16:]
+        new_key = hashlib.scrypt(
+            plain_password.encode("utf-8"), salt=salt, **SCRYPT_PARAMS
+        )
+    else:
+        hashed_password_hex = bytes.fromhex(hashed_password)
+        salt = hashed_password_hex[:16]
+        stored_key = hashed_password_hex[16:]
+        new_key = hashlib.pbkdf2_hmac(
+            method, plain_password.encode("utf-8"), salt, 100000
+        )
     return hmac.compare_digest(stored_key, new_key)
 
 
-async def run_ssh_command(host, username, command):
+def check_password_hash(plain_password, hashed_password, method):
+    """
+    This method is used to generate a password hash
+    Parameters:
+    - plain_password (str): Plaintext password to hash
+    - hashed_password (str): Hexadecimal hash of password
+    - method (str): Algorithm that will use for decode the hash, ignored for
+      hashes carrying the scrypt prefix
+
+    Returns (bool): True or False
+
+    """
+    fast_digest = hmac.new(
+        _FAST_VERIFIER_KEY, plain_password.encode("utf-8"), "sha256"
+    ).digest()
+    now = time.monotonic()
+    with _FAST_VERIFIER_LOCK:
+        cached = _FAST_VERIFIER.get(hashed_password)
+        if cached and cached[1] <= now:
+            del _FAST_VERIFIER[hashed_password]
+            cached = None
+    if cached and hmac.compare_digest(cached[0], fast_digest):
+        return True
+
+    # Key derivation runs in PWD_POOL, so at most one per core runs at a
+    # time however many logins arrive together
+    if not PWD_POOL.submit(
+        _verify_password_key, plain_password, hashed_password, method
+    ).result():
+        return False
+
+    with _FAST_VERIFIER_LOCK:
+        _FAST_VERIFIER[hashed_password] = (fast_digest, now + FAST_VERIFIER_TTL)
+        _FAST_VERIFIER.move_to_end(hashed_password)
+        while len(_FAST_VERIFIER) > FAST_VERIFIER_MAX_ENTRIES:
+            _FAST_VERIFIER.popitem(last=False)
+    return True
+
+
+async def run_ssh_command(host, username, command, ssh_client=None):
     """This is an asynchronous Python function that establishes an SSH connection to a remote host
     and runs a command on it.
 
@@ -132,6 +297,10 @@ async def run_ssh_command(host, username, command):
     The command parameter is a string that represents the command to be executed on the remote
     host via SSH. For example, it could be "ls -l" to list the files in the current directory.
 
+    ssh_client
+    An already opened `RemoteSSHConnection` to reuse. When omitted a one-shot connection
+    to the host is created for this call.
+
     Returns
     -------
     The function `run_ssh_command` is returning the result of running the command on the remote SSH
@@ -140,11 +309,12 @@ async def run_ssh_command(host, username, command):
     strings, or some other data type depending on the output of the command.
 
     """
-    ssh_client = RemoteSSHConnection(host, username)
+    if ssh_client is None:
+        ssh_client = RemoteSSHConnection(host, username)
     return await ssh_client.run_command(command)
 
 
-async def run_scp_send(host, username, local_path, remote_path):
+async def run_scp_send(host, username, local_path, remote_path, ssh_client=None):
     """This is an asynchronous Python function that uploads a local file to a remote server
     using SCP protocol.
 
@@ -166,6 +336,10 @@ async def run_scp_send(host, username, local_path, remote_path):
     The `remote_path` parameter is a string representing the path to the destination file or
     directory on the remote server where the `local_path` file will be uploaded to.
 
+    ssh_client
+    An already opened `RemoteSSHConnection` to reuse. When omitted a one-shot connection
+    to the host is created for this call.
+
     Returns
     -------
     The `run_scp_send` function is returning the result of the `upload_file` method of the
@@ -174,11 +348,12 @@ async def run_scp_send(host, username, local_path, remote_path):
     other relevant information about the upload process.
 
     """
-    ssh_client = RemoteSSHConnection(host, username)
+    if ssh_client is None:
+        ssh_client = RemoteSSHConnection(host, username)
     return await ssh_client.upload_file(local_path, remote_path)
 
 
-async def run_scp_receive(host, username, local_path, remote_path):
+async def run_scp_receive(host, username, local_path, remote_path, ssh_client=None):
     """This is an asynchronous Python function that downloads a file from a remote server
     using SCP protocol.
 
@@ -197,6 +372,10 @@ async def run_scp_receive(host, username, local_path, remote_path):
     remote_path
     The path of the file on the remote server that you want to download.
 
+    ssh_client
+    An already opened `RemoteSSHConnection` to reuse. When omitted a one-shot connection
+    to the host is created for this call.
+
     Returns
     -------
     The function `run_scp_receive` is returning the result of calling the `download_file`
@@ -205,7 +384,8 @@ async def run_scp_receive(host, username, local_path, remote_path):
     The return value of the `download_file`. The return value could be a success/failure
     status or any other relevant information about the upload process.
     """
-    ssh_client = RemoteSSHConnection(host, username)
+    if ssh_client is None:
+        ssh_client = RemoteSSHConnection(host, username)
     return await ssh_client.download_file(remote_path, local_path)
 
 
@@ -232,91 +412,93 @@ async def deploy_loop(lpar_hostname, username, qualifier):
 
     """
 
-    # Getting local dir
-    local_dir = os.path.dirname(os.path.abspath(__file__))
-
-    lpar_name = lpar_hostname.split(".")
-    checking_ipl_space = await run_ssh_command(
-        lpar_hostname,
-        username,
-        f"if [[ -d {ROOT_TMP_ANALYSIS}{lpar_name[0]} ]]; then "
-        f"rm -rf {ROOT_TMP_ANALYSIS}{lpar_name[0]} && "
-        f"mkdir -p {ROOT_TMP_ANALYSIS}{lpar_name[0]}; "
-        f"else; mkdir -p {ROOT_TMP_ANALYSIS}{lpar_name[0]}; fi; "
-        f"ls -la {ROOT_TMP_ANALYSIS}{lpar_name[0]}",
-    )
+    lpar_short_name = lpar_hostname.partition(".")[0]
+    tmp_dir = f"{ROOT_TMP_ANALYSIS}{lpar_short_name}"
+    remote_tmp_dir = shlex.quote(tmp_dir)
+    results_dir = os.path.join(LOCAL_DIR, ROOT_RESULTS, lpar_short_name)
 
-    if checking_ipl_space:
-        files_to_load = [
-            "ipld_calc.awk",
-            "ipld_parsing.awk",
-            "patterns",
-            "main.sh",
-            "methods.sh",
-        ]
-        for file_to_load in files_to_load:
-            await run_scp_send(
-                lpar_hostname,
-                username,
-                os.path.join(local_dir, file_to_load),
-                f"{ROOT_TMP_ANALYSIS}{lpar_name[0]}",
-            )
-
-        await run_ssh_command(
+    # One SSH connection is shared by every command and transfer below
+    async with RemoteSSHConnection(lpar_hostname, username) as ssh_client:
+        checking_ipl_space = await run_ssh_command(
             lpar_hostname,
             username,
-            f"{ROOT_TMP_ANALYSIS}{lpar_name[0]}/main.sh -r cli -a {lpar_hostname} -q {qualifier}",
+            TMP_ANALYSIS_RESET_CMD.format(d=remote_tmp_dir),
+            ssh_client=ssh_client,
         )
 
-        if not os.path.isdir(
-            os.path.join(local_dir, f"{ROOT_RESULTS}/{lpar_name[0]}")
-        ):
-            os.makedirs(
-                os.path.join(local_dir, f"{ROOT_RESULTS}/{lpar_name[0]}")
+        if checking_ipl_space:
+            await asyncio.gather(
+                *(
+                    run_scp_send(
+                        lpar_hostname,
+                        username,
+                        script_path,
+                        tmp_dir,
+                        ssh_client=ssh_client,
+                    )
+                    for script_path in DEPLOY_SCRIPTS
+                )
             )
-            await run_scp_receive(
+
+            await run_ssh_command(
                 lpar_hostname,
                 username,
-                os.path.join(local_dir, f"{ROOT_RESULTS}/{lpar_name[0]}"),
-                f"{ROOT_TMP_ANALYSIS}{lpar_name[0]}/*.CSV",
+                f"{remote_tmp_dir}/main.sh -r cli"
+                f" -a {shlex.quote(lpar_hostname)} -q {shlex.quote(qualifier)}",
+                ssh_client=ssh_client,
             )
 
-        else:
-            shutil.rmtree(f"{ROOT_RESULTS}/{lpar_name[0]}")
-            os.makedirs(
-                os.path.join(local_dir, f"{ROOT_RESULTS}/{lpar_name[0]}")
+            # Download into a staging dir and swap it in with renames, so
+            # the previous results are never half-deleted and the slow
+            # rmtree runs off the event loop
+            os.makedirs(ROOT_RESULTS, exist_ok=True)
+            os.makedirs(ROOT_RESULTS_STAGING, exist_ok=True)
+            incoming_dir = tempfile.mkdtemp(
+                prefix=f"{lpar_short_name}.new.", dir=ROOT_RESULTS_STAGING
             )
             await run_scp_receive(
                 lpar_hostname,
                 username,
-                os.path.join(local_dir, f"{ROOT_RESULTS}/{lpar_name[0]}"),
-                f"{ROOT_TMP_ANALYSIS}{lpar_name[0]}/*.CSV",
+                incoming_dir,
+                f"{tmp_dir}/*.CSV",
+                ssh_client=ssh_client,
+            )
+            os.chmod(incoming_dir, RESULTS_DIR_MODE)
+            stale_dir = None
+            if os.path.isdir(results_dir):
+                stale_dir = tempfile.mkdtemp(
+                    prefix=f"{lpar_short_name}.old.", dir=ROOT_RESULTS_STAGING
+                )
+                os.replace(results_dir, stale_dir)
+            os.replace(incoming_dir, results_dir)
+            if stale_dir:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shutil.rmtree, stale_dir, True
+                )
+
+            await run_ssh_command(
+                lpar_hostname,
+                username,
+                TMP_ANALYSIS_RESET_CMD.format(d=remote_tmp_dir),
+                ssh_client=ssh_client,
             )
+
+        else:
+            return "ERROR"
+
         await run_ssh_command(
             lpar_hostname,
             username,
-            f"if [[ -d {ROOT_TMP_ANALYSIS}{lpar_name[0]} ]]; then "
-            f"rm -rf {ROOT_TMP_ANALYSIS}{lpar_name[0]} && "
-            f"mkdir -p {ROOT_TMP_ANALYSIS}{lpar_name[0]}; "
-            f"else; mkdir -p {ROOT_TMP_ANALYSIS}{lpar_name[0]}; fi; "
-            f"ls -la {ROOT_TMP_ANALYSIS}{lpar_name[0]}",
+            "if [[ -d /tmp/ipl_analysis ]]; then rm -rf /tmp/ipl_analysis; fi",
+            ssh_client=ssh_client,
         )
 
-    else:
-        return "ERROR"
-
-    await run_ssh_command(
-        lpar_hostname,
-        username,
-        "if [[ -d /tmp/ipl_analysis ]]; then rm -rf /tmp/ipl_analysis; fi",
-    )
-
     return f"{lpar_hostname}"
 
 
 def deploy_execution(*identifiers):
-    """This function deploys code execution on multiple LPARs concurrently using
-    a ThreadPoolExecutor and updates the progress and results to the client using SocketIO.
+    """This function deploys code execution on multiple LPARs concurrently on a
+    single asyncio event loop and updates the progress and results to the client using SocketIO.
 
     Returns
     -------
@@ -325,109 +507,103 @@ def deploy_execution(*identifiers):
     """
 
     identifiers_list = tuple(identifiers)
-    lpares_dic = []
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpars_from_db = lpar_database.read(Lpar, in_values={"id": identifiers_list})
+    lpar_database.remove()
+
+    # hostname -> wait/done/error, updated in O(1) as each deploy completes
+    lpar_status = {
+        lpar_row_db.hostname: "wait" for lpar_row_db in lpars_from_db
+    }
 
-    for lpar_row_db in lpars_from_db:
-        lpares_dic.append(f"'{lpar_row_db.hostname}': 'wait'")
+    def progress_result():
+        return [
+            f"'{hostname}': '{status}'"
+            for hostname, status in lpar_status.items()
+        ]
 
     socketio.emit(
         "task_progress",
         {
-            "result": lpares_dic,
+            "result": progress_result(),
             "percent": 10,
             "error": None,
         },
     )
 
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=THREAD_WORKERS
-    ) as executor:
-        futures = []
-        results = []
-        check_lpars = []
-        send_error = []
-
-        for lpar_lines in lpars_from_db:
-            check_lpars.append(lpar_lines.lpar)
-            future_executor = executor.submit(
-                asyncio.run,
-                deploy_loop(
-                    lpar_lines.hostname, lpar_lines.username, lpar_lines.dataset
-                ),
-            )
-            futures.append(future_executor)
+    results = []
+    send_error = []
 
-        for future in concurrent.futures.as_completed(futures):
+    async def deploy_one(lpar_lines, deploy_slots):
+        async with deploy_slots:
             try:
-                result = future.result()
-                results.append(result)
-                socketio.emit("task_completed", results)
+                result = await deploy_loop(
+                    lpar_lines.hostname, lpar_lines.username, lpar_lines.dataset
+                )
+                return lpar_lines.hostname, result, None
             except Exception as error:
+                return lpar_lines.hostname, None, error
+
+    async def deploy_all():
+        nonlocal send_error
+        # Every LPAR shares this one event loop, at most
+        # MAX_CONCURRENT_DEPLOYS of them talk to their host at a time
+        deploy_slots = asyncio.Semaphore(MAX_CONCURRENT_DEPLOYS)
+        deploys = [
+            deploy_one(lpar_lines, deploy_slots) for lpar_lines in lpars_from_db
+        ]
+
+        last_emit = time.monotonic()
+        for completed, deploy in enumerate(
+            asyncio.as_completed(deploys), start=1
+        ):
+            hostname, result, error = await deploy
+            if error is None:
+                results.append(result)
+                lpar_status[hostname] = (
+                    "done" if result == hostname else "error"
+                )
+            else:
+                lpar_status[hostname] = "error"
                 send_error = str(error)
 
-            for i in results:
-                for i_dict, lpares_val in enumerate(lpares_dic):
-                    if i in lpares_val:
-                        lpares_dic[i_dict] = lpares_val.replace(
-                            "'wait'", "'done'"
-                        )
-
-                    if check_lpars:
-                        for check_lpar in check_lpars:
-                            if (
-                                check_lpar in lpares_val
-                                and "done" in lpares_val
-                            ):
-                                check_lpars.remove(check_lpar)
-
-            percent_of_progress = (len(results) / len(futures)) * 100
+            # Coalesce progress updates, the last one is sent after the loop
+            now = time.monotonic()
+            if (
+                completed == len(deploys)
+                or now - last_emit < PROGRESS_EMIT_INTERVAL
+            ):
+                continue
+            last_emit = now
+
+            percent_of_progress = (len(results) / len(deploys)) * 100
             socketio.emit(
                 "task_progress",
                 {
-                    "result": lpares_dic,
+                    "result": progress_result(),
                     "percent": percent_of_progress,
                     "error": send_error,
                 },
             )
 
-        if check_lpars:
-            for check_lpar in check_lpars:
-                for i, lpares in enumerate(lpares_dic):
-                    if check_lpar in lpares:
-                        lpares_dic[i] = lpares.replace("'wait'", "'error'")
-
-        percent_of_progress = (len(results) / len(futures)) * 100
-        socketio.emit(
-            "task_progress",
-            {
-                "result": lpares_dic,
-                "percent": percent_of_progress,
-                "error": send_error,
-            },
-        )
-
-        # Waiting all tasks to be concluded
-        done, _ = concurrent.futures.wait(futures)
+    asyncio.run(deploy_all())
 
-        # Getting the concluded tasks results
-        results = [f.result() for f in done]
-
-        # Printing tasks that are still in progress
-        print([f for f in futures if not f.done()])
-
-        # Las update to the client
-        socketio.emit(
-            "task_progress",
-            {
-                "result": lpares_dic,
-                "percent": percent_of_progress,
-                "error": send_error,
-            },
-        )
+    # as_completed only returns once every deploy is done, so this is the
+    # final state. No LPAR matched (nothing ticked, deleted ids): done
+    socketio.emit(
+        "task_progress",
+        {
+            "result": progress_result(),
+            "percent": (
+                (len(results) / len(lpars_from_db)) * 100
+                if lpars_from_db
+                else 100
+            ),
+            "error": send_error,
+        },
+    )
 
-        return results
+    return results
 
 
 async def dry_run(lpar, username, syslog_qualifier):
@@ -517,12 +693,45 @@ def dry_run_execution(lpar, username, syslog_qualifier):
         print([f for f in futures if not f.done()])
 
 
+# Background deploys and dry runs started from the views share these worker
+# threads instead of each request starting its own
+DEPLOY_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 2),
+    thread_name_prefix="deploy",
+)
+atexit.register(DEPLOY_POOL.shutdown, wait=False)
+
+
+def _log_background_failure(future):
+    # Nothing waits on these futures, so their errors are only seen here
+    if not future.cancelled() and future.exception() is not None:
+        logger.exception(
+            "Background deploy task failed", exc_info=future.exception()
+        )
+
+
+def submit_background(fn, *args):
+    """Run fn(*args) in DEPLOY_POOL, logging any exception it raises."""
+    future = DEPLOY_POOL.submit(fn, *args)
+    future.add_done_callback(_log_background_failure)
+    return future
+
+# scheduler_list renders this snapshot of schedule.get_jobs(), expiring
+# after JOBS_SNAPSHOT_TTL seconds and cleared whenever jobs change
+JOBS_SNAPSHOT_TTL = 2
+_JOBS_SNAPSHOT = None
+_JOBS_SNAPSHOT_LOCK = threading.Lock()
+
+# Long-lived event loop for scheduled deploys, so a job fire only submits a
+# coroutine instead of starting a thread and a new loop
+SCHEDULER_LOOP = asyncio.new_event_loop()
+Thread(target=SCHEDULER_LOOP.run_forever, daemon=True).start()
+
+
 def run_task_scheduler_threads(lpar_hostname, username, qualifier):
-    asyncio_coroutine_run = lambda: asyncio.run(
-        deploy_loop(lpar_hostname, username, qualifier)
+    return asyncio.run_coroutine_threadsafe(
+        deploy_loop(lpar_hostname, username, qualifier), SCHEDULER_LOOP
     )
-    job_thread = threading.Thread(target=asyncio_coroutine_run)
-    job_thread.start()
 
 
 def task_scheduler_set(
@@ -536,107 +745,69 @@ def task_scheduler_set(
 ):
     if cancel_jobs:
         schedule.clear()
-    elif day_of_week == "sunday":
-        job = (
-            schedule.every()
-            .sunday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
+        clear_jobs_snapshot()
+        return
+
+    day_attr = SCHEDULE_DAY_ATTRS.get(day_of_week)
+    if day_attr is None:
+        return
+
+    job = (
+        getattr(schedule.every(), day_attr)
+        .at(schedule_time)
+        .do(
+            run_task_scheduler_threads,
+            lpar_hostname=lpar_hostname,
+            username=username,
+            qualifier=dataset,
         )
-    elif day_of_week == "monday":
-        job = (
-            schedule.every()
-            .monday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week == "tuesday":
-        job = (
-            schedule.every()
-            .tuesday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week == "wednesday":
-        job = (
-            schedule.every()
-            .wednesday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week == "thursday":
-        job = (
-            schedule.every()
-            .thursday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week == "friday":
-        job = (
-            schedule.every()
-            .friday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week == "saturday":
-        job = (
-            schedule.every()
-            .saturday.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
-            )
-            .tag(received_tag)
-        )
-    elif day_of_week is None:
-        job = {
-            schedule.every()
-            .day.at(schedule_time)
-            .do(
-                run_task_scheduler_threads,
-                lpar_hostname=lpar_hostname,
-                username=username,
-                qualifier=dataset,
+        .tag(received_tag)
+    )
+    clear_jobs_snapshot()
+    return job
+
+
+def jobs_snapshot():
+    """The function returns the scheduled jobs as a list of dicts, rebuilt at most every
+    JOBS_SNAPSHOT_TTL seconds.
+
+    Returns
+    -------
+    a list with the tags, last/next run, unit, interval and period of each scheduled job.
+
+    """
+    global _JOBS_SNAPSHOT
+    now = time.monotonic()
+    with _JOBS_SNAPSHOT_LOCK:
+        if _JOBS_SNAPSHOT is None or _JOBS_SNAPSHOT[0] <= now:
+            _JOBS_SNAPSHOT = (
+                now + JOBS_SNAPSHOT_TTL,
+                [
+                    {
+                        "lpar": job.tags,
+                        "task": job,
+                        "last_run": job.last_run,
+                        "next_run": job.next_run,
+                        "unit": job.unit,
+                        "interval": job.interval,
+                        "period": job.period,
+                    }
+                    for job in schedule.get_jobs()
+                ],
             )
-            .tag(received_tag)
-        }
+        return _JOBS_SNAPSHOT[1]
+
+
+def clear_jobs_snapshot():
+    global _JOBS_SNAPSHOT
+    with _JOBS_SNAPSHOT_LOCK:
+        _JOBS_SNAPSHOT = None
 
 
 def task_scheduler_manager():
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpar_list_db = lpar_database.read(Lpar)
+    lpar_database.remove()
     try:
         for lpar in lpar_list_db:
             if len(lpar.schedule) > 8:
@@ -660,18 +831,59 @@ def task_scheduler_manager():
                     day_of_week=None,
                     cancel_jobs=None,
                 )
+        # Sleep until the next job is due instead of polling every second;
+        # jobs are only registered above, so no jobs means nothing to run
         while True:
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                break
+            if idle_seconds > 0:
+                time.sleep(min(idle_seconds, 60))
             schedule.run_pending()
-            time.sleep(1)
     except Exception as error:
         print(str(error))
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider for jsonify and request.get_json backed by orjson, keeping the default
+    provider's handling of dates, decimals and dataclasses.
+
+    orjson would serialize dates and dataclasses itself (ISO 8601 dates), so they are
+    passed through to the default provider's hook, which keeps Flask's HTTP date format.
+
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Running Web Server with Flasks
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 app.config["ENVIRONMENT"] = os.getenv("ENVIRONMENT")
 app.template_folder = os.path.join(os.path.dirname(__file__), "templates")
+# Templates only change on deploy: skip the per-request stat/recompile check
+# (even under debug=True) and keep compiled bytecode across restarts
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_options = {
+    **app.jinja_options,
+    "cache_size": JINJA_CACHE_SIZE,
+    "bytecode_cache": FileSystemBytecodeCache(JINJA_CACHE_DIR),
+}
+app.json = OrjsonProvider(app)
 socketio = SocketIO(app)
 csrf = CSRFProtect(app)
 login_manager = LoginManager()
@@ -692,6 +904,13 @@ def inject_app():
     return {"app": app}
 
 
+@app.teardown_appcontext
+def remove_db_sessions(exception=None):
+    """Hands the request's database connections back to the shared pools."""
+    READ_DB.remove()
+    WRITE_DB.remove()
+
+
 class User(UserMixin):
     """
     The above class is a user class that inherits from the UserMixin class.
@@ -744,7 +963,7 @@ def load_user(user_id):
 
     """
     try:
-        user_db = CrudDB(ZPLATIPLD_URL_DB)
+        user_db = READ_DB
         user = user_db.read(Users, condition={"id": user_id})
         return (
             User(
@@ -784,12 +1003,23 @@ def do_login():
     username = request.form["username"]
     password = request.form["password"]
 
-    user_db = CrudDB(ZPLATIPLD_URL_DB)
+    user_db = READ_DB
     user = user_db.read(Users, condition={"username": username})
 
     try:
         if username == user[0].username:
             if check_password_hash(password, user[0].password, "sha256"):
+                if not user[0].password.startswith(SCRYPT_PREFIX):
+                    # Lazily migrate legacy PBKDF2 hashes to scrypt
+                    WRITE_DB.update(
+                        Users,
+                        {"id": user[0].id},
+                        {
+                            "password": PWD_POOL.submit(
+                                generate_password_hash, password, "scrypt"
+                            ).result()
+                        },
+                    )
                 session["approved"] = user[0].approved
                 userl = User(
                     user[0].id,
@@ -873,7 +1103,7 @@ def signup_save():
     the user has been created successfully and needs to wait for an admin to approve their account.
 
     """
-    password = generate_password_hash(request.form["password"], method="sha256")
+    password = generate_password_hash(request.form["password"], method="scrypt")
     data = {
         "username": request.form["username"],
         "password": password,
@@ -882,8 +1112,19 @@ def signup_save():
         "approved": 0,
     }
 
-    signup_db = CrudDB(ZPLATIPLD_URL_DB)
-    signup_db.create(Users, data=data)
+    signup_db = WRITE_DB
+    try:
+        with signup_db.transaction():
+            signup_db.create(Users, data=data)
+    except IntegrityError:
+        # user.username carries a unique index
+        return render_template(
+            "signup.html",
+            notification=(
+                "danger",
+                f"The username {request.form['username']} is already taken.",
+            ),
+        )
 
     return render_template(
         LOGIN_HTML,
@@ -906,7 +1147,7 @@ def vault_ssh_keys():
     the ID, username, private key, and public key for each key stored in the database.
 
     """
-    key_vault_database = CrudDB(ZPLATIPLD_URL_DB)
+    key_vault_database = READ_DB
     keys_from_db = key_vault_database.read(Vault)
 
     return render_template(VAULT_SSH_HTML, results=keys_from_db)
@@ -931,8 +1172,9 @@ def vault_ssh_keys_save():
         "public_key": request.form["public_key"],
     }
     try:
-        key_vault_database = CrudDB(ZPLATIPLD_URL_DB)
-        key_vault_database.create(Vault, data=data)
+        key_vault_database = WRITE_DB
+        with key_vault_database.transaction():
+            key_vault_database.create(Vault, data=data)
 
         return redirect(
             url_for(
@@ -967,7 +1209,7 @@ def lpar_tasks():
     the query are passed to the template as a variable called "results".
 
     """
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpars_from_db = lpar_database.read(Lpar, condition={"enable": 1})
 
     return render_template("lpar_tasks.html", results=lpars_from_db)
@@ -997,13 +1239,11 @@ def lpar_tasks_run(id=None):
     """
     if request.method == "POST":
         identifiers = tuple(map(int, request.form.getlist("identifier[]")))
-        tasks_run = Thread(target=deploy_execution, args=(*identifiers,))
-        tasks_run.start()
+        submit_background(deploy_execution, *identifiers)
         return render_template("lpar_tasks_run.html")
     elif request.method == "GET":
         identifiers = (id, 0)
-        tasks_run = Thread(target=deploy_execution, args=(*identifiers,))
-        tasks_run.start()
+        submit_background(deploy_execution, *identifiers)
         return render_template("lpar_tasks_run.html")
 
 
@@ -1011,21 +1251,7 @@ def lpar_tasks_run(id=None):
 # @app.route("/scheduler/list/<string:action>")
 @login_required
 def scheduler_list():
-    schedules_result = []
-    active_schedule = schedule.get_jobs()
-    for act_sc in active_schedule:
-        schedules_result.append(
-            {
-                "lpar": act_sc.tags,
-                "task": act_sc,
-                "last_run": act_sc.last_run,
-                "next_run": act_sc.next_run,
-                "unit": act_sc.unit,
-                "interval": act_sc.interval,
-                "period": act_sc.period,
-            }
-        )
-    return render_template("scheduler_list.html", results=schedules_result)
+    return render_template("scheduler_list.html", results=jobs_snapshot())
 
 
 @app.route("/lpar/settings", methods=["GET"])
@@ -1041,25 +1267,22 @@ def lpar_settings():
     called "results".
 
     """
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpars_from_db = lpar_database.read(Lpar)
     return render_template(LPAR_SETTINGS_HTML, results=lpars_from_db)
 
 
 @app.route("/lpar/settings/dry-run", methods=["POST"])
 @login_required
-async def lpar_settings_dry_run():
-    thread_run = Thread(
-        target=dry_run_execution,
-        args=(
-            request.form["hostname"],
-            request.form["user_id"],
-            request.form["dataset"],
-        ),
+def lpar_settings_dry_run():
+    submit_background(
+        dry_run_execution,
+        request.form["hostname"],
+        request.form["user_id"],
+        request.form["dataset"],
     )
-    thread_run.start()
 
-    return 0
+    return "", 204
 
 
 @app.route("/lpar/settings/new/step-1", methods=["GET"])
@@ -1075,7 +1298,7 @@ def lpar_settings_new():
     called "results".
 
     """
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpars_from_db = lpar_database.read(Lpar)
 
     return render_template("lpar_settings_new.html", results=lpars_from_db)
@@ -1083,16 +1306,13 @@ def lpar_settings_new():
 
 @app.route("/lpar/settings/new/step-2", methods=["POST"])
 @login_required
-async def lpar_settings_new_step2():
-    thread_run = Thread(
-        target=dry_run_execution,
-        args=(
-            request.form["hostname"],
-            request.form["user_id"],
-            request.form["dataset"],
-        ),
+def lpar_settings_new_step2():
+    submit_background(
+        dry_run_execution,
+        request.form["hostname"],
+        request.form["user_id"],
+        request.form["dataset"],
     )
-    thread_run.start()
 
     field_list = {
         "lpar": request.form["lpar"],
@@ -1125,12 +1345,20 @@ def lpar_settings_insert():
     USER_ID = request.form["user_id"]
 
     try:
-        lpar_database = CrudDB(ZPLATIPLD_URL_DB)
-        check_lpar_before_insert = lpar_database.read(
-            Lpar, condition={"hostname": HOSTNAME}
+        lpar_database = WRITE_DB
+        data = {
+            "lpar": LPAR,
+            "hostname": HOSTNAME,
+            "dataset": DATASET,
+            "username": USER_ID,
+            "enable": 1,
+        }
+        # lpar.hostname is unique, the insert is skipped for an existing one
+        created = lpar_database.create_if_absent(
+            Lpar, data=data, unique_columns=["hostname"]
         )
 
-        if check_lpar_before_insert:
+        if not created:
             return render_template(
                 LPAR_SETTINGS_HTML,
                 notification=(
@@ -1138,23 +1366,13 @@ def lpar_settings_insert():
                     f"The LPAR {LPAR} already exists. Please provide a unique LPAR.",
                 ),
             )
-        else:
-            data = {
-                "lpar": LPAR,
-                "hostname": HOSTNAME,
-                "dataset": DATASET,
-                "username": USER_ID,
-                "enable": 1,
-            }
-            lpar_database.create(Lpar, data=data)
-
-            return render_template(
-                LPAR_SETTINGS_HTML,
-                notification=(
-                    "success",
-                    f"The LPAR {LPAR} was created successfully.",
-                ),
-            )
+        return render_template(
+            LPAR_SETTINGS_HTML,
+            notification=(
+                "success",
+                f"The LPAR {LPAR} was created successfully.",
+            ),
+        )
     except Exception as error:
         return render_template(
             LPAR_SETTINGS_HTML,
@@ -1185,7 +1403,7 @@ def lpar_settings_detail(id):
     The results include the LPAR name, hostname, dataset, username, enabled status, and ID.
 
     """
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
+    lpar_database = READ_DB
     lpars_from_db = lpar_database.read(Lpar, condition={"id": id})
 
     return render_template(LPAR_SETTINGS_DET_HTML, results=lpars_from_db)
@@ -1210,38 +1428,56 @@ def lpar_settings_update(id):
     indicating whether the update was successful or not.
 
     """
-    fields_to_query = {
-        "lpar": request.form["lpar"],
-        "hostname": request.form["hostname"],
-        "dataset": request.form["dataset"],
-        "username": request.form["username"],
-        "enabled": request.form["enabled"],
-        "schedule": request.form["schedule"],
-    }
-    lpar_database = CrudDB(ZPLATIPLD_URL_DB)
-    lpars_from_db = lpar_database.update(Lpar, {"id": id}, fields_to_query)
+    lpar_database = WRITE_DB
 
     try:
-        lpar_database.update("lpar", record_id={"id": id}, data=fields_to_query)
-        return render_template(
-            LPAR_SETTINGS_DET_HTML,
-            results=lpars_from_db,
-            notification=(
-                "success",
-                f"The LPAR {request.form['lpar']} configuration has been updated successfully.",
-            ),
+        # Inside the try: a non-numeric "enabled" is reported like any
+        # other failed update
+        fields_to_query = {
+            "lpar": request.form["lpar"],
+            "hostname": request.form["hostname"],
+            "dataset": request.form["dataset"],
+            "username": request.form["username"],
+            "enable": int(request.form["enabled"]),
+            "schedule": request.form["schedule"],
+        }
+        lpar_database.update_values(Lpar, {"id": id}, fields_to_query)
+        notification = (
+            "success",
+            f"The LPAR {request.form['lpar']} configuration has been updated successfully.",
         )
     except Exception as error:
-        return render_template(
-            LPAR_SETTINGS_DET_HTML,
-            results=lpars_from_db,
-            notification=(
-                "danger",
-                f"An error occurred while updating the LPAR {request.form['lpar']} "
-                f"settings. [{error}]",
-            ),
+        notification = (
+            "danger",
+            f"An error occurred while updating the LPAR {request.form['lpar']} "
+            f"settings. [{error}]",
         )
 
+    lpars_from_db = lpar_database.read(Lpar, condition={"id": id})
+    return render_template(
+        LPAR_SETTINGS_DET_HTML,
+        results=lpars_from_db,
+        notification=notification,
+    )
+
+
+def list_dir_entries(path):
+    """The function lists a directory with a single scandir pass.
+
+    Parameters
+    ----------
+    path
+    The directory to list.
+
+    Returns
+    -------
+    a list of (name, is_dir) tuples. The type comes from the directory entry itself, so the
+    template does not stat every file again.
+
+    """
+    with os.scandir(path) as dir_entries:
+        return [(entry.name, entry.is_dir()) for entry in dir_entries]
+
 
 @app.route("/lpar/reports", methods=["GET"])
 @login_required
@@ -1250,20 +1486,17 @@ def lpar_results_show_dir():
 
     Returns
     -------
-    a rendered HTML template called "lpar_results.html" with the variables "files", "dir_path",
-    "os", and "root_dir" passed as arguments. The "files" variable contains a list of files in
-    the directory "/zplatipld/results". The "dir_path" variable is an empty string. The "os"
-    variable is the Python built-in module
+    a rendered HTML template called "lpar_results.html" with the variables "entries" and
+    "dir_path" passed as arguments. The "entries" variable contains a (name, is_dir) tuple for
+    each entry of the directory "/zplatipld/results". The "dir_path" variable is an empty string.
 
     """
 
-    files = os.listdir(ROOT_RESULTS)
+    entries = list_dir_entries(ROOT_RESULTS)
     return render_template(
         "lpar_results.html",
-        files=files,
+        entries=entries,
         dir_path="",
-        os=os,
-        root_dir=ROOT_RESULTS,
     )
 
 
@@ -1282,31 +1515,31 @@ def lpar_results_show_dir_dynamic(dir_path=""):
 
     Returns
     -------
-    a rendered HTML template with the list of files in the specified directory path, along with the
-    directory path, root directory, and the os module.
+    a rendered HTML template with the (name, is_dir) entries of the specified directory path,
+    along with the directory path.
 
     """
 
-    safe_base_path = os.path.abspath(ROOT_RESULTS)
-    requested_path = os.path.abspath(os.path.join(safe_base_path, dir_path))
+    # Pure string normalization against the root resolved at import, no
+    # filesystem calls until the scandir itself
+    requested_path = PurePath(
+        os.path.normpath(os.path.join(SAFE_RESULTS_PATH, dir_path))
+    )
 
-    if not requested_path.startswith(safe_base_path):
+    if not requested_path.is_relative_to(SAFE_RESULTS_PATH):
         abort(403, description="Access denied.")
 
-    if not os.path.isdir(requested_path):
-        abort(404, description="Not found")
-
     try:
-        files = os.listdir(requested_path)
+        entries = list_dir_entries(requested_path)
+    except (FileNotFoundError, NotADirectoryError):
+        abort(404, description="Not found")
     except OSError as error:
         abort(500, description=f"Error accessing the direcotry: {error}")
 
     return render_template(
         "lpar_results.html",
-        files=files,
+        entries=entries,
         dir_path=dir_path,
-        os=os,
-        root_dir=ROOT_RESULTS,
     )
 
 
@@ -1329,53 +1562,29 @@ def lpar_results_download_file(file_path):
 
     """
 
-    print("AQUI: ", ROOT_RESULTS)
-    print("\n\nAQUI2: ", file_path)
-    if os.path.isfile(f"{ROOT_RESULTS}/{file_path}"):
-        return send_from_directory(ROOT_RESULTS, file_path)
-    flash("Error: File not found")
-    return redirect(url_for("lpar_results_show_dir"))
+    # send_from_directory rejects paths escaping ROOT_RESULTS, streams through
+    # wsgi.file_wrapper when the server offers it and answers conditional and
+    # Range requests (ETag/Last-Modified) with 304/206
+    try:
+        return send_from_directory(
+            ROOT_RESULTS, file_path, max_age=RESULTS_DOWNLOAD_MAX_AGE
+        )
+    except NotFound:
+        flash("Error: File not found")
+        return redirect(url_for("lpar_results_show_dir"))
 
 
 @app.route("/lpar/results/<string:view>", methods=["GET"])
 @login_required
 def lpar_results_table(view):
-    import datetime
-
     # Running Ingest Data Before
     system_to_duration_ingest = zplatipld_ingest()
     if system_to_duration_ingest:
-        system_to_duration_ingest_uncompressed = []
-        for uncompress_list in system_to_duration_ingest:
-            system_to_duration_ingest_uncompressed.append(uncompress_list[0])
-        system_to_duration_ingest_uncompressed = list(
-            set(system_to_duration_ingest_uncompressed)
-        )
-        duration_ingest(system_to_duration_ingest_uncompressed)
+        duration_ingest(list({row[0] for row in system_to_duration_ingest}))
 
     if view == "done":
-        done_db = CrudDB(ZPLATIPLD_URL_DB)
-        load_done_results = done_db.read(ResultsDoneTable)
-
-        results = []
-        for result in load_done_results:
-            result_to_dict = {
-                "id": result.id,
-                "sysname": result.sysname,
-                "ipl_date": result.ipl_date,
-                "log_dataset": result.log_dataset,
-                "pre_ipl": result.pre_ipl,
-                "shutdown_begin": result.shutdown_begin,
-                "shutdown_end": result.shutdown_end,
-                "ipl_begin": result.ipl_begin,
-                "ipl_end": result.ipl_end,
-                "pos_ipl": result.pos_ipl,
-                "shutdown_duration": result.shutdown_duration,
-                "poweroff_duration": result.poweroff_duration,
-                "load_ipl": result.load_ipl,
-                "total_duration": result.total_duration,
-            }
-            results.append(result_to_dict)
+        done_db = READ_DB
+        results = done_db.read_columns(RESULTS_DONE_COLUMNS)
 
         return render_template(
             "lpar_results_table.html",
@@ -1383,43 +1592,20 @@ def lpar_results_table(view):
             results=results,
         )
     elif view == "fail":
-        fail_db = CrudDB(ZPLATIPLD_URL_DB)
-        load_done_results = fail_db.read(ResultsFailTable)
-
-        results = []
-        for result in load_done_results:
-            result_to_dict = {
-                "id": result.id,
-                "sysname": result.sysname,
-                "log_dataset": result.log_dataset,
-                "pre_ipl": result.pre_ipl,
-                "shutdown_begin": result.shutdown_begin,
-                "shutdown_end": result.shutdown_end,
-                "ipl_begin": result.ipl_begin,
-                "ipl_end": result.ipl_end,
-                "pos_ipl": result.pos_ipl,
-            }
-            results.append(result_to_dict)
+        fail_db = READ_DB
+        results = fail_db.read_columns(RESULTS_FAIL_COLUMNS)
 
         return render_template(
             "lpar_results_table_fail.html",
             results=results,
         )
     elif view == "last_ipl":
-        last_ipl_db = CrudDB(ZPLATIPLD_URL_DB)
-        load_done_results = last_ipl_db.read(
-            (ResultsLastIplTable),
-            distinct="sysname,last_ipl",
+        last_ipl_db = READ_DB
+        results = last_ipl_db.read_columns(
+            (ResultsLastIplTable.sysname, ResultsLastIplTable.last_ipl),
+            distinct=True,
         )
 
-        results = []
-        for result in load_done_results:
-            result_to_dict = {
-                "sysname": result.sysname,
-                "last_ipl": result.last_ipl,
-            }
-            results.append(result_to_dict)
-
         return render_template(
             "lpar_results_table_last_ipl.html",
             results=results,
@@ -1434,27 +1620,25 @@ def people_access_approve():
 
     Returns
     -------
-    a rendered HTML template called "people_access_approve.html" with the
+    a streamed HTML template called "people_access_approve.html" with the
     results of a database query for user information including username, name,
-    last name, approval status, and ID.
+    last name, approval status, and ID, fetched PEOPLE_BATCH_SIZE rows at a time.
 
     """
-    people_db = CrudDB(ZPLATIPLD_URL_DB)
-    people = people_db.read(Users)
-
-    results = []
-    for register in people:
-        results.append(
-            {
-                "username": register.username,
-                "name": register.name,
-                "last_name": register.last_name,
-                "approved": register.approved,
-                "id": register.id,
-            }
-        )
+    people_db = READ_DB
+    results = people_db.read_columns(
+        (
+            Users.username,
+            Users.name,
+            Users.last_name,
+            Users.approved,
+            Users.id,
+        ),
+        batch_size=PEOPLE_BATCH_SIZE,
+    )
 
-    return render_template("people_access_approve.html", results=results)
+    # Rows are rendered and sent as they are fetched
+    return stream_template("people_access_approve.html", results=results)
 
 
 @app.route(
@@ -1482,12 +1666,12 @@ def people_access_approve_action(action, id):
 
     """
     if action == "unblock":
-        people_access_db = CrudDB(ZPLATIPLD_URL_DB)
+        people_access_db = WRITE_DB
         data = {"approved": 1}
         register_id = {"id": id}
         people_access_db.update(Users, register_id, data=data)
     else:
-        people_access_db = CrudDB(ZPLATIPLD_URL_DB)
+        people_access_db = WRITE_DB
         data = {"approved": 0}
         register_id = {"id": id}
         people_access_db.update(Users, register_id, data=data)
@@ -1502,22 +1686,26 @@ def import_database(action=None):
     if not action:
         return render_template("system_database_import.html")
     elif action == "add":
-        import json
-
-        lpar_database = CrudDB(ZPLATIPLD_URL_DB)
-        table = request.form["table"]
+        table = IMPORT_TABLES.get(request.form["table"].strip().lower())
+        if table is None:
+            abort(400, description="Unknown table to import.")
         data_to_import = request.form["data_to_import"]
-        data_to_json = json.dumps(data_to_import)
-        json_loads_data = json.loads(data_to_json)
-        teste = jsonify(json_loads_data)
-        print(teste)
-        # for data in data_to_import.split(","):
-        #     # lpar_database.create(Lpar,data)
-        #     dict_data = ast.literal_eval(data)
-        #     print(dict_data.get("lpar"))
-        lpars_result = lpar_database.read(Lpar)
-        # return render_template(LPAR_SETTINGS_HTML,results=lpars_result)
-        return json_loads_data
+        try:
+            json_loads_data = json.loads(data_to_import)
+        except json.JSONDecodeError as error:
+            abort(400, description=f"Invalid JSON to import: {error}")
+        rows = (
+            [json_loads_data]
+            if isinstance(json_loads_data, dict)
+            else json_loads_data
+        )
+
+        lpar_database = WRITE_DB
+        try:
+            imported = lpar_database.create_many(table, rows)
+        except Exception as error:
+            abort(400, description=f"Error importing data: {error}")
+        return jsonify({"table": table.__tablename__, "imported": imported})
 
 
 host_env = os.getenv("HOST")
@@ -1527,7 +1715,7 @@ debug_env = os.getenv("DEBUG")
 
 if __name__ == "__main__":
     # teste
-    db_init = CrudDB(ZPLATIPLD_URL_DB)
+    db_init = WRITE_DB
     db_init.init_database()
     schedule_thread_run = Thread(target=task_scheduler_manager, daemon=True)
     schedule_thread_run.start()
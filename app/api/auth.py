@@ -8,14 +8,15 @@ from flask import (
     Blueprint,
     Response,
     flash,
+    g,
     redirect,
     render_template,
     request,
     session,
-    url_for,
 )
 from flask_login import UserMixin, login_required, login_user, logout_user
 
+from app.api.urls import static_url
 from app.application.dtos import (
     UserApprovalActionDTO,
     UserCreateDTO,
@@ -121,14 +122,21 @@ def create_auth_blueprint(
             Exception: If an error occurs while loading the user.
         """
 
+        # Memoized on flask.g so the user is fetched once per request
+        request_users = g.setdefault("_user_cache", {})
+        if user_id in request_users:
+            return request_users[user_id]
+
         try:
             domain_user = auth_service.get_user_by_id(int(user_id))
             if domain_user:
-                return FlaskLoginUser(
+                flask_user = FlaskLoginUser(
                     domain_user[0].id,
                     domain_user[0].username,
                     domain_user[0].approved,
                 )
+                request_users[user_id] = flask_user
+                return flask_user
         except Exception as e:
             print(f"Error loading user: {e}")
         else:
@@ -167,7 +175,7 @@ def create_auth_blueprint(
             login_user(flask_user)
             session["approved"] = authenticated_user.approved
             flash("Logged in successfully!", "success")
-            return redirect(url_for("index"))
+            return redirect(static_url("index"))
         if authenticated_user and authenticated_user.approved == 0:
             flash(
                 "Your account is pending approval. Please wait for an admin.",
@@ -191,7 +199,7 @@ def create_auth_blueprint(
 
         logout_user()
         flash("You have been logged out.", "info")
-        return redirect(url_for("auth_bp.login"))
+        return redirect(static_url("auth_bp.login"))
 
     @auth_bp.route("/signup", methods=["GET"])
     def signup_form() -> str:
@@ -239,7 +247,7 @@ def create_auth_blueprint(
                 "approve your account.",
                 "success",
             )
-            return redirect(url_for("auth_bp.login"))
+            return redirect(static_url("auth_bp.login"))
         except Exception as e:
             flash(f"An error occurred during signup: {e}", "danger")
             return render_template("signup.html")
@@ -308,6 +316,6 @@ def create_auth_blueprint(
             )
         else:
             flash(f"Failed to update approval for user ID {id}.", "danger")
-        return redirect(url_for("auth_bp.people_access_approve"))
+        return redirect(static_url("auth_bp.people_access_approve"))
 
     return auth_bp
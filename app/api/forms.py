@@ -0,0 +1,86 @@
+"""
+Contains form access helpers shared by the application's blueprints.
+"""
+
+from typing import Any
+
+from flask import abort, request
+from werkzeug.exceptions import BadRequestKeyError
+
+
+class FormData(dict):
+    """A plain dict of the submitted form fields.
+
+    A missing field raises BadRequestKeyError, so the request is answered
+    with 400 just like indexing request.form directly.
+    """
+
+    def __missing__(self, key: str) -> str:
+        raise BadRequestKeyError(key)
+
+
+def form_data() -> FormData:
+    """Copies the first value of every submitted form field into a dict.
+
+    Returns:
+        FormData: The submitted fields, read with plain dict lookups.
+    """
+
+    return FormData(request.form.to_dict(flat=True))
+
+
+def coerce_field(name: str, value: str, field_type: type) -> Any:
+    """Converts a submitted form value to the given type.
+
+    Args:
+        name (str): The name of the field, for the error message.
+        value (str): The submitted value.
+        field_type (type): The expected type. A bool field is True only
+            when the submitted value is "true", as sent by the checkboxes.
+
+    Returns:
+        Any: The converted value. Aborts with 400 when it is invalid.
+    """
+
+    if field_type is bool:
+        return value == "true"
+    if field_type is str:
+        return value
+    try:
+        return field_type(value)
+    except ValueError:
+        abort(400, description=f"Invalid value for form field '{name}'")
+
+
+def typed_form(
+    required: dict[str, type], optional: dict[str, type] | None = None
+) -> dict[str, Any]:
+    """Reads and converts form fields in a single pass over the form.
+
+    Args:
+        required (dict[str, type]): The fields that must be submitted,
+            with their types.
+        optional (dict[str, type], optional): The fields that may be
+            omitted. A missing optional field is None, or False for a
+            bool field. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The converted fields. Aborts with 400 when a
+            required field is missing or a value is invalid.
+    """
+
+    optional = optional or {}
+    form = request.form.to_dict(flat=True)
+    missing = [name for name in required if name not in form]
+    if missing:
+        abort(400, description=f"Missing form fields: {', '.join(missing)}")
+
+    fields = {}
+    for fields_types in (required, optional):
+        for name, field_type in fields_types.items():
+            value = form.get(name)
+            if value is None:
+                fields[name] = False if field_type is bool else None
+            else:
+                fields[name] = coerce_field(name, value, field_type)
+    return fields
@@ -10,12 +10,14 @@ from flask import (
     flash,
     jsonify,
     redirect,
-    render_template,
     request,
     url_for,
 )
 from flask_login import login_required
 
+from app.api.forms import form_data
+from app.api.templating import render
+from app.api.urls import static_url
 from app.application.dtos import DryRunRequestDTO, LparCreateDTO, LparUpdateDTO
 from app.application.services.lpar_service import LparService
 from app.application.use_cases.dry_run_check import DryRunCheckUseCase
@@ -53,7 +55,7 @@ def create_lpar_blueprint(
         """
 
         lpars = lpar_service.get_all_lpars()
-        return render_template("lpar_settings.html", results=lpars)
+        return render("lpar_settings.html", results=lpars)
 
     @lpar_bp.route("/lpar/settings/new/step-1", methods=["GET"])
     @login_required
@@ -69,7 +71,7 @@ def create_lpar_blueprint(
             including its name, UUID, and other attributes.
         """
         lpars = lpar_service.get_all_lpars()
-        return render_template("lpar_settings_new.html", results=lpars)
+        return render("lpar_settings_new.html", results=lpars)
 
     @lpar_bp.route("/lpar/settings/new/step-2", methods=["POST"])
     @login_required
@@ -90,24 +92,25 @@ def create_lpar_blueprint(
             the LPAR settings creation process.
         """
 
-        hostname = request.form["hostname"]
-        username = request.form["user_id"]
-        dataset = request.form["dataset"]
-        lpar_name = request.form["lpar"]
+        form = form_data()
+        hostname = form["hostname"]
+        username = form["user_id"]
+        dataset = form["dataset"]
+        lpar_name = form["lpar"]
         dry_run_dto = DryRunRequestDTO(
             hostname=hostname, username=username, dataset=dataset
         )
 
-        # Execute dry run asynchronously in a separate thread,
+        # The view is already async: run the checks on its event loop
         # and pass the socketio_emit function for updates.
-        dry_run_use_case.execute(dry_run_dto, socketio_emit)
+        await dry_run_use_case.execute_async(dry_run_dto, socketio_emit)
         field_list = {
             "lpar": lpar_name,
             "hostname": hostname,
             "dataset": dataset,
             "user_id": username,
         }
-        return render_template(
+        return render(
             "lpar_settings_new_step2.html", results=field_list
         )
 
@@ -127,15 +130,16 @@ def create_lpar_blueprint(
                 and an HTTP status code.
         """
 
-        hostname = request.form["hostname"]
-        username = request.form["user_id"]
-        dataset = request.form["dataset"]
+        form = form_data()
+        hostname = form["hostname"]
+        username = form["user_id"]
+        dataset = form["dataset"]
         dry_run_dto = DryRunRequestDTO(
             hostname=hostname, username=username, dataset=dataset
         )
-        # Execute dry run asynchronously in a separate thread,
+        # The view is already async: run the checks on its event loop
         # and pass the socketio_emit function for updates.
-        dry_run_use_case.execute(dry_run_dto, socketio_emit)
+        await dry_run_use_case.execute_async(dry_run_dto, socketio_emit)
         return jsonify({"status": "Dry run initiated"}), 202
 
     @lpar_bp.route("/lpar/settings/new", methods=["POST"])
@@ -153,10 +157,11 @@ def create_lpar_blueprint(
             Response: A Flask response object.
         """
 
-        lpar_name = request.form["lpar"]
-        hostname = request.form["hostname"]
-        dataset = request.form["dataset"]
-        username = request.form["user_id"]
+        form = form_data()
+        lpar_name = form["lpar"]
+        hostname = form["hostname"]
+        dataset = form["dataset"]
+        username = form["user_id"]
         create_dto = LparCreateDTO(
             lpar=lpar_name,
             hostname=hostname,
@@ -174,7 +179,7 @@ def create_lpar_blueprint(
                 f"The LPAR {lpar_name} already exists or an error occurred.",
                 "danger",
             )
-        return redirect(url_for("lpar_bp.lpar_settings"))
+        return redirect(static_url("lpar_bp.lpar_settings"))
 
     @lpar_bp.route("/lpar/settings/<int:id>", methods=["GET"])
     @login_required
@@ -195,8 +200,8 @@ def create_lpar_blueprint(
         lpar = lpar_service.get_lpar_by_id(id)
         if not lpar:
             flash("LPAR not found.", "danger")
-            return redirect(url_for("lpar_bp.lpar_settings"))
-        return render_template("lpar_settings_detail.html", results=[lpar])
+            return redirect(static_url("lpar_bp.lpar_settings"))
+        return render("lpar_settings_detail.html", results=[lpar])
 
     @lpar_bp.route("/lpar/settings/update/<int:id>", methods=["POST"])
     @login_required
@@ -218,14 +223,15 @@ def create_lpar_blueprint(
                 LPAR information.
         """
 
+        form = form_data()
         update_dto = LparUpdateDTO(
             id=id,
-            lpar=request.form["lpar"],
-            hostname=request.form["hostname"],
-            dataset=request.form["dataset"],
-            username=request.form["username"],
-            enabled=int(request.form["enabled"]),
-            schedule=request.form["schedule"],
+            lpar=form["lpar"],
+            hostname=form["hostname"],
+            dataset=form["dataset"],
+            username=form["username"],
+            enabled=int(form["enabled"]),
+            schedule=form["schedule"],
         )
         updated_lpar = lpar_service.update_lpar(update_dto)
         if updated_lpar:
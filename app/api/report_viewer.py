@@ -4,27 +4,139 @@ within the application.
 """
 
 import datetime
+import hashlib
 import os
+import time
+from pathlib import Path, PurePath
+from types import MappingProxyType
+from typing import Any
 
 import flask
+import orjson
 import werkzeug
 from flask import (
     Blueprint,
     Response,
     abort,
     flash,
+    make_response,
     redirect,
-    render_template,
     request,
     send_from_directory,
-    url_for,
+    session,
 )
 from flask_login import login_required
+from werkzeug.exceptions import NotFound
 
+from app.api.templating import render, stream
+from app.api.urls import static_url
 from app.application.dtos import ReportFilterDTO
 from app.application.services.report_service import ReportService
 from app.infrastructure.config.settings import app_settings
 
+RESULTS_TABLE_TEMPLATES = MappingProxyType(
+    {
+        "done": "lpar_results_table.html",
+        "fail": "lpar_results_table_fail.html",
+        "last_ipl": "lpar_results_table_last_ipl.html",
+    }
+)
+RESULTS_VIEWS = frozenset(RESULTS_TABLE_TEMPLATES)
+# Seconds a page entity tag stays valid, well within the CSRF token lifetime
+PAGE_ETAG_WINDOW = 1800
+
+
+def list_dir_entries(path: str) -> list[tuple[str, bool]]:
+    """Lists a directory with a single scandir pass.
+
+    Args:
+        path (str): The directory to list.
+
+    Returns:
+        list[tuple[str, bool]]: The (name, is_dir) pair of every entry. The
+            type comes from the directory entry itself, so the template
+            does not stat each file again.
+    """
+
+    with os.scandir(path) as dir_entries:
+        return [(entry.name, entry.is_dir()) for entry in dir_entries]
+
+
+def page_etag(*parts: Any) -> str:
+    """Builds the entity tag of a rendered page.
+
+    Pages embed the session's CSRF token, which Flask-WTF only accepts for
+    an hour, so the tag also covers the session token and a half-hour time
+    window: a cached copy is never revalidated with a stale token.
+
+    Args:
+        *parts (Any): The values the page content is derived from.
+
+    Returns:
+        str: The entity tag.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        *parts,
+        session.get("csrf_token", ""),
+        int(time.time()) // PAGE_ETAG_WINDOW,
+    ):
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def revalidate(response: Response, etag: str) -> Response:
+    """Adds an entity tag to a response and makes clients revalidate it.
+
+    Args:
+        response (Response): The response to update.
+        etag (str): The entity tag of the content.
+
+    Returns:
+        Response: The same response.
+    """
+
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified(etag: str) -> Response | None:
+    """Answers a conditional GET whose cached copy is still current.
+
+    Args:
+        etag (str): The entity tag of the current content.
+
+    Returns:
+        Response | None: A 304 response, or None when the content has to
+            be sent.
+    """
+
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return revalidate(Response(status=304), etag)
+
+
+def directory_etag(path: str | PurePath, dir_path: str) -> str:
+    """Builds the entity tag of a directory listing page.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed, which is all the listing shows.
+
+    Args:
+        path (str | PurePath): The directory.
+        dir_path (str): The directory path shown on the page.
+
+    Returns:
+        str: The entity tag.
+    """
+
+    stat = os.stat(path)
+    return page_etag(dir_path, stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
 
 def create_report_blueprint(report_service: ReportService) -> Blueprint:
     """Creates a blueprint for handling LPAR report routes.
@@ -37,38 +149,71 @@ def create_report_blueprint(report_service: ReportService) -> Blueprint:
     """
 
     report_bp = Blueprint("report_bp", __name__)
+    # Read and resolved once; requests only normalize their path against it
+    root_results = app_settings.ROOT_RESULTS
+    results_root = Path(root_results).resolve()
+    results_root_str = os.fspath(results_root)
+
+    def results_path(relative_path: str) -> PurePath:
+        """Maps a request path onto the results directory.
+
+        Args:
+            relative_path (str): The path relative to the results directory.
+
+        Returns:
+            PurePath: The normalized absolute path. Aborts with 403 when it
+                falls outside the results directory.
+        """
+
+        path = PurePath(
+            os.path.normpath(os.path.join(results_root_str, relative_path))
+        )
+        if not path.is_relative_to(results_root):
+            abort(403, description="Access denied.")
+        return path
 
     @report_bp.route("/lpar/reports", methods=["GET"])
     @login_required
-    def lpar_results_show_dir() -> str:
+    def lpar_results_show_dir() -> Response:
         """Shows the results directory for the current user.
 
         Returns:
-            str: The rendered HTML template for the LPAR results directory.
+            Response: The rendered LPAR results directory, or a 304 response
+                when the client's copy is current.
         """
 
+        etag = None
         try:
-            files = os.listdir(app_settings.ROOT_RESULTS)
+            etag = directory_etag(root_results, "")
+            if response := not_modified(etag):
+                return response
+            entries = list_dir_entries(root_results)
         except FileNotFoundError:
-            files = []
+            etag = None
+            entries = []
             flash(
                 "Results directory not found. Please run a deployment first.",
                 "info",
             )
         except OSError as e:
-            files = []
+            etag = None
+            entries = []
             flash(f"Error accessing results directory: {e}", "danger")
-        return render_template(
-            "lpar_results.html",
-            files=files,
-            dir_path="",  # Root path
-            os=os,  # Pass os module for path manipulation in template (e.g., isdir, isfile)
-            root_dir=app_settings.ROOT_RESULTS,
+        response = make_response(
+            render(
+                "lpar_results.html",
+                entries=entries,
+                dir_path="",  # Root path
+                root_dir=root_results,
+            )
         )
+        if etag:
+            revalidate(response, etag)
+        return response
 
     @report_bp.route("/lpar/reports/<path:dir_path>", methods=["GET"])
     @login_required
-    def lpar_results_show_dir_dynamic(dir_path: str = "") -> str:
+    def lpar_results_show_dir_dynamic(dir_path: str = "") -> Response:
         """Show the results directory.
 
         Args:
@@ -76,30 +221,30 @@ def create_report_blueprint(report_service: ReportService) -> Blueprint:
                 the root results directory.
 
         Returns:
-            render_template: The rendered template with the list of files and
-                directory path.
+            Response: The rendered template with the list of files and
+                directory path, or a 304 response when the client's copy is
+                current.
         """
 
-        safe_base_path = os.path.abspath(app_settings.ROOT_RESULTS)
-        requested_path = os.path.abspath(
-            os.path.join(safe_base_path, dir_path)
-        )
-
-        if not requested_path.startswith(safe_base_path):
-            abort(403, description="Access denied.")
-        if not os.path.isdir(requested_path):
-            abort(404, description="Not found")
+        requested_path = results_path(dir_path)
         try:
-            files = os.listdir(requested_path)
+            etag = directory_etag(requested_path, dir_path)
+            if response := not_modified(etag):
+                return response
+            entries = list_dir_entries(requested_path)
+        except (FileNotFoundError, NotADirectoryError):
+            abort(404, description="Not found")
         except OSError as error:
             abort(500, description=f"Error accessing the directory: {error}")
-        return render_template(
-            "lpar_results.html",
-            files=files,
-            dir_path=dir_path,
-            os=os,
-            root_dir=app_settings.ROOT_RESULTS,
+        response = make_response(
+            render(
+                "lpar_results.html",
+                entries=entries,
+                dir_path=dir_path,
+                root_dir=root_results,
+            )
         )
+        return revalidate(response, etag)
 
     @report_bp.route(
         "/lpar/reports/download/<path:file_path>", methods=["GET"]
@@ -119,19 +264,20 @@ def create_report_blueprint(report_service: ReportService) -> Blueprint:
                 downloaded.
 
         Raises:
-            FileNotFoundError: If the specified file does not exist in
-                the LPAR results directory.
+            NotFound: Handled here: a missing file or a path outside the
+                results directory redirects to the results directory.
         """
 
-        full_file_path = os.path.join(app_settings.ROOT_RESULTS, file_path)
-        if os.path.isfile(full_file_path):
-            return send_from_directory(app_settings.ROOT_RESULTS, file_path)
-        flash("Error: File not found", "danger")
-        return redirect(url_for("report_bp.lpar_results_show_dir"))
+        # send_from_directory safe-joins the path and stats the file once
+        try:
+            return send_from_directory(results_root_str, file_path)
+        except NotFound:
+            flash("Error: File not found", "danger")
+            return redirect(static_url("report_bp.lpar_results_show_dir"))
 
     @report_bp.route("/lpar/results/<string:view>", methods=["GET"])
     @login_required
-    def lpar_results_table(view: str) -> str:
+    def lpar_results_table(view: str) -> Response:
         """
         Generate a table of LPAR results based on the specified view.
 
@@ -140,23 +286,35 @@ def create_report_blueprint(report_service: ReportService) -> Blueprint:
             "fail", or "last_ipl".
 
         Returns:
-        - str: The rendered HTML template for the LPAR results table.
+        - Response: The LPAR results table, rendered in chunks, or a 304
+            response when the client's copy is current.
+
+        Raises:
+        - NotFound: If the view is not one of the supported views.
         """
 
+        if view not in RESULTS_VIEWS:
+            abort(404)
+
         report_filter_dto = ReportFilterDTO(view_type=view)
-        results = report_service.get_ipl_reports(report_filter_dto)
-
-        template_map = {
-            "done": "lpar_results_table.html",
-            "fail": "lpar_results_table_fail.html",
-            "last_ipl": "lpar_results_table_last_ipl.html",
-        }
-        template_name = template_map.get(view, "lpar_results_table.html")
-        return render_template(
-            template_name,
-            datetime=datetime,
-            results=results,
+        # Rows are only read once the table renders, and their dicts are
+        # built one at a time while it streams
+        results = report_service.iter_ipl_reports(report_filter_dto)
+
+        # Unchanged table: answer 304 without reading its rows
+        etag = page_etag(view, *results.version())
+        if response := not_modified(etag):
+            return response
+
+        # Large tables: rows are sent as they are rendered
+        response = Response(
+            stream(
+                RESULTS_TABLE_TEMPLATES[view],
+                datetime=datetime,
+                results=results,
+            )
         )
+        return revalidate(response, etag)
 
     @report_bp.route("/system/database/import", methods=["GET", "POST"])
     @report_bp.route(
@@ -174,27 +332,25 @@ def create_report_blueprint(report_service: ReportService) -> Blueprint:
         """
 
         if request.method == "GET":
-            return render_template("system_database_import.html")
+            return render("system_database_import.html")
         if request.method == "POST" and action == "add":
-            import json
-
             try:
                 table_name = request.form["table"]
                 data_to_import_str = request.form["data_to_import"]
 
-                _data_list = json.loads(data_to_import_str)
+                _data_list = orjson.loads(data_to_import_str)
                 flash(
                     f"Import to table '{table_name}' "
                     "initiated (logic placeholder).",
                     "info",
                 )
-                return redirect(url_for("report_bp.import_database"))
-            except json.JSONDecodeError:
+                return redirect(static_url("report_bp.import_database"))
+            except orjson.JSONDecodeError:
                 flash("Invalid JSON data provided.", "danger")
             except Exception as e:
                 flash(f"An error occurred during import: {e}", "danger")
-            return render_template("system_database_import.html")
+            return render("system_database_import.html")
         flash("Invalid import action.", "danger")
-        return redirect(url_for("report_bp.import_database"))
+        return redirect(static_url("report_bp.import_database"))
 
     return report_bp
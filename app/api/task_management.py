@@ -3,26 +3,61 @@ Handles API endpoints and related logic for managing tasks within
 the application.
 """
 
-import threading
+import atexit
+import logging
+import re
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from flask import (
     Blueprint,
     Response,
+    abort,
     flash,
     redirect,
-    render_template,
     request,
-    url_for,
 )
 from flask_login import login_required
 
+from app.api.forms import typed_form
+from app.api.templating import render
+from app.api.urls import static_url
 from app.application.dtos import ScheduleTaskDTO, TaskRunRequestDTO
 from app.application.services.task_service import TaskService
 from app.application.use_cases.deploy_lpar_task import DeployLparTaskUseCase
 from app.application.use_cases.schedule_lpar_task import (
     ScheduleLparTaskUseCase,
 )
+from app.infrastructure.config.settings import app_settings
+
+# Deploy runs share a fixed set of worker threads instead of one new thread
+# per request
+DEPLOY_POOL = ThreadPoolExecutor(
+    max_workers=app_settings.DEPLOY_POOL_SIZE, thread_name_prefix="deploy"
+)
+atexit.register(DEPLOY_POOL.shutdown, wait=False)
+
+logger = logging.getLogger(__name__)
+
+# Scheduler tags are LPAR names; z/OS names may also use @ and $
+SCHEDULER_TAG_RE = re.compile(r"[A-Za-z0-9_.@$-]{1,64}")
+
+
+def log_deploy_failure(future: Future) -> None:
+    """Logs the exception of a finished deploy run, if it raised one.
+
+    Nothing waits on the futures of DEPLOY_POOL, so this done-callback is
+    the only place their errors surface.
+
+    Args:
+        future (Future): The finished deploy run.
+
+    Returns:
+        None
+    """
+
+    if not future.cancelled() and future.exception() is not None:
+        logger.exception("Deploy task failed", exc_info=future.exception())
 
 
 def create_task_blueprint(
@@ -66,7 +101,7 @@ def create_task_blueprint(
         lpars = task_service.lpar_repo.find(
             task_service.lpar_repo.model, criteria={"enable": 1}
         )
-        return render_template("lpar_tasks.html", results=lpars)
+        return render("lpar_tasks.html", results=lpars)
 
     @task_bp.route("/lpar/tasks/run", methods=["POST"])
     @task_bp.route("/lpar/tasks/run/<int:id>", methods=["GET"])
@@ -85,17 +120,24 @@ def create_task_blueprint(
         """
 
         if request.method == "POST":
-            identifiers = tuple(map(int, request.form.getlist("identifier[]")))
+            try:
+                lpar_ids = [
+                    int(identifier)
+                    for identifier in request.form.getlist("identifier[]")
+                ]
+            except ValueError:
+                abort(400, description="Invalid LPAR identifier")
         elif request.method == "GET" and id is not None:
-            identifiers = (id,)
+            lpar_ids = [id]
         else:
-            return redirect(url_for("task_bp.lpar_tasks"))
-        task_run_dto = TaskRunRequestDTO(lpar_ids=list(identifiers))
-        threading.Thread(
-            target=deploy_lpar_task_use_case.execute,
-            args=(task_run_dto, socketio_emit),
-        ).start()
-        return render_template("lpar_tasks_run.html")
+            lpar_ids = []
+        if not lpar_ids:
+            return redirect(static_url("task_bp.lpar_tasks"))
+        task_run_dto = TaskRunRequestDTO(lpar_ids=lpar_ids)
+        DEPLOY_POOL.submit(
+            deploy_lpar_task_use_case.execute, task_run_dto, socketio_emit
+        ).add_done_callback(log_deploy_failure)
+        return render("lpar_tasks_run.html")
 
     @task_bp.route("/scheduler/list", methods=["GET"])
     @login_required
@@ -112,7 +154,7 @@ def create_task_blueprint(
         """
 
         schedules_result = task_service.get_scheduled_tasks()
-        return render_template("scheduler_list.html", results=schedules_result)
+        return render("scheduler_list.html", results=schedules_result)
 
     @task_bp.route("/scheduler/set", methods=["POST"])
     @login_required
@@ -132,20 +174,20 @@ def create_task_blueprint(
         - None
         """
 
-        lpar_id = int(request.form["lpar_id"])
-        schedule_time = request.form["schedule_time"]
-        day_of_week = request.form.get("day_of_week")  # Optional
+        form = typed_form(
+            {"lpar_id": int, "schedule_time": str},
+            {"day_of_week": str, "cancel_jobs": bool},
+        )
         schedule_dto = ScheduleTaskDTO(
-            lpar_id=lpar_id,
-            schedule_time=schedule_time,
-            day_of_week=day_of_week,
-            cancel_jobs=request.form.get("cancel_jobs")
-            == "true",  # Check if checkbox is ticked
+            lpar_id=form["lpar_id"],
+            schedule_time=form["schedule_time"],
+            day_of_week=form["day_of_week"],  # Optional
+            cancel_jobs=form["cancel_jobs"],  # Checkbox ticked
         )
         schedule_lpar_task_use_case.execute(schedule_dto)
         flash("Task scheduled successfully!", "success")
         return redirect(
-            url_for("lpar_bp.lpar_settings")
+            static_url("lpar_bp.lpar_settings")
         )  # Redirect back to LPAR settings or similar
 
     @task_bp.route("/scheduler/clear/<string:tag>", methods=["GET"])
@@ -158,11 +200,16 @@ def create_task_blueprint(
 
         Returns:
             None
+
+        Raises:
+            BadRequest: If the tag is not a valid scheduler tag.
         """
 
+        if not SCHEDULER_TAG_RE.fullmatch(tag):
+            abort(400, description="Invalid scheduler tag")
         task_service.clear_scheduled_tasks(tag=tag)
         flash(f"Scheduled tasks with tag '{tag}' cleared.", "info")
-        return redirect(url_for("task_bp.scheduler_list"))
+        return redirect(static_url("task_bp.scheduler_list"))
 
     @task_bp.route("/scheduler/clear_all", methods=["GET"])
     @login_required
@@ -178,6 +225,6 @@ def create_task_blueprint(
 
         task_service.clear_scheduled_tasks(tag=None)
         flash("All scheduled tasks cleared.", "info")
-        return redirect(url_for("task_bp.scheduler_list"))
+        return redirect(static_url("task_bp.scheduler_list"))
 
     return task_bp
@@ -0,0 +1,65 @@
+"""
+Contains template rendering helpers shared by the application's blueprints.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from flask import current_app, render_template, stream_template
+from jinja2 import Template
+
+
+def get_template(template_name: str) -> Template:
+    """Returns a compiled template, looking it up in the Jinja environment
+    only once per application.
+
+    Args:
+        template_name (str): The name of the template.
+
+    Returns:
+        Template: The compiled template.
+    """
+
+    templates: dict[str, Template] = current_app.extensions.setdefault(
+        "template_cache", {}
+    )
+    template = templates.get(template_name)
+    if template is None:
+        template = current_app.jinja_env.get_template(template_name)
+        templates[template_name] = template
+    return template
+
+
+def render(template_name: str, **context: Any) -> str:
+    """Renders a template, looking it up in the Jinja environment only once.
+
+    The compiled Template object is memoized per application, then handed to
+    Flask's render_template so context processors, flashed messages and
+    template signals keep working.
+
+    Args:
+        template_name (str): The name of the template to render.
+        **context (Any): The variables to make available in the template.
+
+    Returns:
+        str: The rendered template.
+    """
+
+    return render_template(get_template(template_name), **context)
+
+
+def stream(template_name: str, **context: Any) -> Iterator[str]:
+    """Renders a template in chunks, to be sent as they are produced.
+
+    Like render, the compiled template is memoized and context processors
+    still run. The request context is kept alive while streaming.
+
+    Args:
+        template_name (str): The name of the template to render.
+        **context (Any): The variables to make available in the template.
+
+    Returns:
+        Iterator[str]: The rendered template, chunk by chunk.
+    """
+
+    return stream_template(get_template(template_name), **context)
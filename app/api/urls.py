@@ -0,0 +1,29 @@
+"""
+Contains a URL building helper shared by the application's blueprints.
+"""
+
+from flask import current_app, request, url_for
+
+
+def static_url(endpoint: str) -> str:
+    """Builds the URL of an endpoint that takes no arguments, once.
+
+    The URL only depends on the endpoint and the script root the
+    application is mounted under, so it is memoized per application
+    instead of walking the URL map on every redirect.
+
+    Args:
+        endpoint (str): The endpoint to build the URL for.
+
+    Returns:
+        str: The URL of the endpoint.
+    """
+
+    urls: dict[tuple[str, str], str] = current_app.extensions.setdefault(
+        "static_url_cache", {}
+    )
+    key = (request.script_root, endpoint)
+    url = urls.get(key)
+    if url is None:
+        url = urls[key] = url_for(endpoint)
+    return url
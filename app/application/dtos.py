@@ -1,11 +1,15 @@
 """
 Defines data transfer objects (DTOs) for application APIs.
+
+The request DTOs built once per request and only read afterwards are
+NamedTuples, which are cheaper to create than frozen dataclasses.
 """
 
 from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserCreateDTO:
     """Data Transfer Object for creating a new user."""
 
@@ -15,7 +19,7 @@ class UserCreateDTO:
     last_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserLoginDTO:
     """Data Transfer Object for user login."""
 
@@ -23,7 +27,7 @@ class UserLoginDTO:
     password: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LparCreateDTO:
     """Data Transfer Object for creating a new LPAR."""
 
@@ -33,7 +37,7 @@ class LparCreateDTO:
     username: str  # SSH username for LPAR
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LparUpdateDTO:
     """Data Transfer Object for updating an LPAR."""
 
@@ -46,7 +50,7 @@ class LparUpdateDTO:
     schedule: str | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VaultEntryCreateDTO:
     """Data Transfer Object for creating a new Vault entry."""
 
@@ -55,15 +59,13 @@ class VaultEntryCreateDTO:
     public_key: str
 
 
-@dataclass
-class TaskRunRequestDTO:
+class TaskRunRequestDTO(NamedTuple):
     """Data Transfer Object for requesting LPAR task execution."""
 
     lpar_ids: list[int]
 
 
-@dataclass
-class DryRunRequestDTO:
+class DryRunRequestDTO(NamedTuple):
     """Data Transfer Object for requesting a dry run."""
 
     hostname: str
@@ -71,7 +73,7 @@ class DryRunRequestDTO:
     dataset: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DryRunStatusDTO:
     """Data Transfer Object for dry run status updates."""
 
@@ -81,7 +83,7 @@ class DryRunStatusDTO:
     check_tmp_space: str = "wait"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskProgressDTO:
     """Data Transfer Object for task progress updates."""
 
@@ -90,8 +92,7 @@ class TaskProgressDTO:
     error: str | None
 
 
-@dataclass
-class ScheduleTaskDTO:
+class ScheduleTaskDTO(NamedTuple):
     """Data Transfer Object for scheduling a task."""
 
     lpar_id: int
@@ -100,14 +101,13 @@ class ScheduleTaskDTO:
     cancel_jobs: bool | None = False
 
 
-@dataclass
-class ReportFilterDTO:
+class ReportFilterDTO(NamedTuple):
     """Data Transfer Object for filtering reports."""
 
     view_type: str  # e.g., "done", "fail", "last_ipl"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserApprovalActionDTO:
     """Data Transfer Object for approving/unapproving user access."""
 
@@ -115,7 +115,7 @@ class UserApprovalActionDTO:
     action: str  # "unblock" or "block"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseImportDTO:
     """Data Transfer Object for importing database content."""
 
@@ -5,16 +5,43 @@ Classes:
     AuthService: Handles user registration, login, and approval status updates.
 """
 
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+
 from app.application.dtos import (
     UserApprovalActionDTO,
     UserCreateDTO,
     UserLoginDTO,
 )
+from app.application.services.result_cache import ResultCache
 from app.domain.entities import User
 from app.domain.repositories import IUserRepository
 from app.domain.services import IPasswordHasher
 from app.infrastructure.persistence.models import UserModel
 
+logger = logging.getLogger(__name__)
+
+# Short-lived cache for get_user_by_id, hit by the Flask-Login user loader
+# on every authenticated request.
+USER_CACHE_TTL = 30
+USER_CACHE_MAXSIZE = 512
+# The people approval page lists every user
+ALL_USERS_CACHE_TTL = 5.0
+
+# Recently verified logins, so repeated logins of the same account skip the
+# password KDF. Entries are keyed by an HMAC of the password under a
+# per-process random key, never the password itself, and include the stored
+# hash so a password change invalidates them. The tradeoff: for
+# VERIFY_CACHE_TTL seconds a known-good password is matched in memory
+# instead of by the KDF, and a memory dump reveals which keyed digests
+# were recently accepted.
+VERIFY_CACHE_TTL = 30.0
+VERIFY_CACHE_MAXSIZE = 1024
+
 
 class AuthService:
     """
@@ -39,6 +66,29 @@ class AuthService:
 
         self.user_repo = user_repo
         self.password_hasher = password_hasher
+        self._user_cache: dict[int, tuple[float, User]] = {}
+        self._user_cache_lock = threading.Lock()
+        self._all_users: ResultCache[list[User]] = ResultCache(
+            ALL_USERS_CACHE_TTL
+        )
+        self._verify_cache: dict[tuple[str, str, bytes], float] = {}
+        self._verify_cache_key = secrets.token_bytes(32)
+        self._verify_cache_lock = threading.Lock()
+
+    def _invalidate_user(self, user_id: int | None) -> None:
+        """
+        Drops a user from the get_user_by_id and get_all_users caches.
+
+        Args:
+            user_id (int | None): The ID of the user to drop.
+
+        Returns:
+            None
+        """
+
+        with self._user_cache_lock:
+            self._user_cache.pop(user_id, None)
+        self._all_users.clear()
 
     def register_user(self, dto: UserCreateDTO) -> User | None:
         """Register a new user.
@@ -60,7 +110,10 @@ class AuthService:
             last_name=dto.last_name,
             approved=0,
         )
-        return self.user_repo.create(new_user)
+        created_user = self.user_repo.create(new_user)
+        if created_user:
+            self._invalidate_user(created_user.id)
+        return created_user
 
     def verify_login(self, dto: UserLoginDTO) -> User | None:
         """
@@ -80,9 +133,61 @@ class AuthService:
             return None
 
         user = users[0]
-        if self.password_hasher.check_password(dto.password, user.password):
-            return user
-        return None
+        cache_key = (
+            dto.username,
+            user.password,
+            hmac.digest(
+                self._verify_cache_key, dto.password.encode(), hashlib.sha256
+            ),
+        )
+        now = time.monotonic()
+        with self._verify_cache_lock:
+            expires = self._verify_cache.get(cache_key)
+            if expires and expires > now:
+                return user
+
+        if not self.password_hasher.check_password(
+            dto.password, user.password
+        ):
+            return None
+
+        if self.password_hasher.needs_rehash(user.password):
+            self._rehash_password(user, dto.password)
+            cache_key = (cache_key[0], user.password, cache_key[2])
+
+        with self._verify_cache_lock:
+            self._verify_cache.pop(cache_key, None)
+            if len(self._verify_cache) >= VERIFY_CACHE_MAXSIZE:
+                # FIFO eviction: dicts keep insertion order
+                del self._verify_cache[next(iter(self._verify_cache))]
+            self._verify_cache[cache_key] = now + VERIFY_CACHE_TTL
+        return user
+
+    def _rehash_password(self, user: User, password: str) -> None:
+        """
+        Replaces an outdated password hash, once the password is known
+        to be right.
+
+        A failure is logged and the old hash is kept, so the login still
+        succeeds and the rehash is retried on the next one.
+
+        Args:
+            user (User): The user that just logged in.
+            password (str): The verified plain text password.
+
+        Returns:
+            None
+        """
+
+        old_hash = user.password
+        user.password = self.password_hasher.hash_password(password)
+        try:
+            self.user_repo.update_many([user])
+        except Exception:
+            logger.exception(f"Failed to rehash password of {user.username}")
+            user.password = old_hash
+            return
+        self._invalidate_user(user.id)
 
     def get_user_by_id(self, user_id: int) -> User | None:
         """
@@ -94,7 +199,20 @@ class AuthService:
         Returns:
             User | None: The retrieved User object if found, otherwise None.
         """
-        return self.user_repo.get_by_id(user_id)
+
+        now = time.monotonic()
+        with self._user_cache_lock:
+            cached = self._user_cache.get(user_id)
+            if cached and cached[0] > now:
+                return cached[1]
+
+        user = self.user_repo.get_by_id(user_id)
+        if user:
+            with self._user_cache_lock:
+                if len(self._user_cache) >= USER_CACHE_MAXSIZE:
+                    self._user_cache.clear()
+                self._user_cache[user_id] = (now + USER_CACHE_TTL, user)
+        return user
 
     def get_all_users(self) -> list[User]:
         """
@@ -108,7 +226,7 @@ class AuthService:
             the system.
         """
 
-        return self.user_repo.get_all()
+        return self._all_users.get(self.user_repo.get_all)
 
     def update_user_approval(self, dto: UserApprovalActionDTO) -> User | None:
         """
@@ -123,9 +241,46 @@ class AuthService:
                 the user was not found.
         """
 
-        user_to_update = self.user_repo.get_by_id(dto.user_id)
-        if not user_to_update:
-            return None
+        updated_users = self.update_user_approvals([dto])
+        return updated_users[0] if updated_users else None
+
+    def update_user_approvals(
+        self, dtos: list[UserApprovalActionDTO]
+    ) -> list[User]:
+        """
+        Updates the approval status of several users at once.
+
+        The users are loaded with one query and saved in one transaction,
+        whatever the number of actions.
+
+        Parameters:
+            - dtos (list[UserApprovalActionDTO]): The user IDs and actions to
+                be performed. When a user appears more than once, the last
+                action wins.
+
+        Returns:
+            - list[User]: The updated users. Unknown user IDs are skipped.
+        """
+
+        if not dtos:
+            return []
+
+        users_by_id = {
+            user.id: user
+            for user in self.user_repo.get_many_by_ids(
+                [dto.user_id for dto in dtos]
+            )
+        }
+        users_to_update = {}
+        for dto in dtos:
+            user = users_by_id.get(dto.user_id)
+            if user is None:
+                continue
+            user.approved = 1 if dto.action == "unblock" else 0
+            users_to_update[dto.user_id] = user
 
-        user_to_update.approved = 1 if dto.action == "unblock" else 0
-        return self.user_repo.update(user_to_update)
+        if not users_to_update:
+            return []
+        for user_id in users_to_update:
+            self._invalidate_user(user_id)
+        return self.user_repo.update_many(list(users_to_update.values()))
@@ -6,9 +6,13 @@ Classes:
 """
 
 from app.application.dtos import LparCreateDTO, LparUpdateDTO
+from app.application.services.result_cache import ResultCache
 from app.domain.entities import Lpar
 from app.domain.repositories import ILparRepository
 
+# The LPAR list pages auto-refresh, while the table changes at minute scale
+LPARS_CACHE_TTL = 5.0
+
 
 class LparService:
     """
@@ -25,6 +29,7 @@ class LparService:
                 storing and retrieving LPAR data.
         """
         self.lpar_repo = lpar_repo
+        self._all_lpars: ResultCache[list[Lpar]] = ResultCache(LPARS_CACHE_TTL)
 
     def create_lpar(self, dto: LparCreateDTO) -> Lpar | None:
         """
@@ -56,7 +61,9 @@ class LparService:
             schedule=None,
         )
 
-        return self.lpar_repo.create(new_lpar)
+        created_lpar = self.lpar_repo.create(new_lpar)
+        self._all_lpars.clear()
+        return created_lpar
 
     def get_all_lpars(self) -> list[Lpar]:
         """
@@ -70,7 +77,7 @@ class LparService:
                 the system.
         """
 
-        return self.lpar_repo.get_all()
+        return self._all_lpars.get(self.lpar_repo.get_all)
 
     def get_enabled_lpars(self) -> list[Lpar]:
         """
@@ -123,4 +130,6 @@ class LparService:
         lpar_to_update.enable = dto.enable
         lpar_to_update.schedule = dto.schedule
 
-        return self.lpar_repo.update()
+        updated_lpar = self.lpar_repo.update()
+        self._all_lpars.clear()
+        return updated_lpar
@@ -2,6 +2,9 @@
 Contains services related to generating reports.
 """
 
+import operator
+import threading
+from collections.abc import Callable, Iterator, Sequence
 from typing import Any
 
 from app.application.dtos import ReportFilterDTO
@@ -12,6 +15,90 @@ from app.domain.repositories import (
 )
 from app.infrastructure.ingest.ipl_data_ingest import IPLDataIngestor
 
+# Report columns per view; rows are read with a single C-level attrgetter
+DONE_FIELDS = (
+    "id",
+    "sysname",
+    "ipl_date",
+    "log_dataset",
+    "pre_ipl",
+    "shutdown_begin",
+    "shutdown_end",
+    "ipl_begin",
+    "ipl_end",
+    "pos_ipl",
+    "shutdown_duration",
+    "poweroff_duration",
+    "load_ipl",
+    "total_duration",
+)
+FAIL_FIELDS = (
+    "id",
+    "sysname",
+    "log_dataset",
+    "pre_ipl",
+    "shutdown_begin",
+    "shutdown_end",
+    "ipl_begin",
+    "ipl_end",
+    "pos_ipl",
+)
+LAST_IPL_FIELDS = ("sysname", "last_ipl")
+DONE_GETTER = operator.attrgetter(*DONE_FIELDS)
+FAIL_GETTER = operator.attrgetter(*FAIL_FIELDS)
+LAST_IPL_GETTER = operator.attrgetter(*LAST_IPL_FIELDS)
+
+
+class ReportRows:
+    """
+    The rows of one report view, loaded on first use and turned into dicts
+    only while iterating.
+
+    Attributes:
+        rows (Sequence[Any]): The loaded table rows.
+        fields (tuple[str, ...]): The report columns.
+    """
+
+    __slots__ = ("_loader", "_rows", "_versioner", "fields", "getter")
+
+    def __init__(
+        self,
+        loader: Callable[[], Sequence[Any]],
+        versioner: Callable[[], tuple[Any, ...]],
+        fields: tuple[str, ...],
+        getter: Callable[[Any], tuple[Any, ...]],
+    ) -> None:
+        self._loader = loader
+        self._versioner = versioner
+        self._rows: Sequence[Any] | None = None
+        self.fields = fields
+        self.getter = getter
+
+    @property
+    def rows(self) -> Sequence[Any]:
+        if self._rows is None:
+            self._rows = self._loader()
+        return self._rows
+
+    def version(self) -> tuple[Any, ...]:
+        """
+        Returns a token that changes whenever the rows change, read without
+        loading them.
+
+        Returns:
+            tuple[Any, ...]: The version of the underlying table.
+        """
+
+        return self._versioner()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        fields, getter = self.fields, self.getter
+        for row in self.rows:
+            yield dict(zip(fields, getter(row)))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
 
 class ReportService:
     """
@@ -46,6 +133,29 @@ class ReportService:
         self.results_fail_repo = results_fail_repo
         self.results_last_ipl_repo = results_last_ipl_repo
         self.ipl_data_ingestor = ipl_data_ingestor
+        # Serializes ingestion, so concurrent requests never ingest twice
+        self._ingest_lock = threading.Lock()
+        # view_type -> (loader, versioner, report columns, row getter)
+        self._views = {
+            "done": (
+                results_done_repo.get_all_results_done,
+                results_done_repo.get_results_done_version,
+                DONE_FIELDS,
+                DONE_GETTER,
+            ),
+            "fail": (
+                results_fail_repo.get_all_results_fail,
+                results_fail_repo.get_results_fail_version,
+                FAIL_FIELDS,
+                FAIL_GETTER,
+            ),
+            "last_ipl": (
+                results_last_ipl_repo.get_all_last_ipl_results,
+                results_last_ipl_repo.get_last_ipl_results_version,
+                LAST_IPL_FIELDS,
+                LAST_IPL_GETTER,
+            ),
+        }
 
     def get_ipl_reports(self, dto: ReportFilterDTO) -> list[dict[str, Any]]:
         """
@@ -81,61 +191,54 @@ class ReportService:
 
         """
 
+        return list(self.iter_ipl_reports(dto))
+
+    def iter_ipl_reports(self, dto: ReportFilterDTO) -> ReportRows:
+        """
+        Get IPL reports like get_ipl_reports, without building every row's
+        dictionary up front.
+
+        Parameters:
+            dto (ReportFilterDTO): A data transfer object containing
+                the filter criteria.
+
+        Returns:
+            ReportRows: The rows, read from the database on first use and
+                yielding one report dictionary at a time when iterated.
+                Can be iterated more than once.
+        """
+
+        # Every view is built from ingested data, but the CSV files only
+        # change after a deploy, so most requests skip ingestion entirely.
+        # Checked again under the lock: a request that waited for another
+        # one's ingestion finds the data current
+        if self.ipl_data_ingestor.is_stale():
+            with self._ingest_lock:
+                if self.ipl_data_ingestor.is_stale():
+                    self._ingest_new_data()
+
+        view = self._views.get(dto.view_type)
+        if view is None:
+            return ReportRows(tuple, tuple, (), tuple)
+        return ReportRows(*view)
+
+    def _ingest_new_data(self) -> None:
+        """
+        Ingests new raw data from the result CSV files and processes it into
+        the report tables.
+
+        Returns:
+            None
+        """
+
         # 1. Ingest new raw data from CSVs
         systems_with_new_data = self.ipl_data_ingestor.ingest_raw_ipl_data()
 
-        # 2. Process newly ingested raw data into structured tables
-        flattened_sysname_list = [
-            sys for sublist in systems_with_new_data for sys in sublist
-        ]
-        unique_sysnames = list(set(flattened_sysname_list))
+        # 2. Process newly ingested raw data into structured tables. The
+        # shards are consumed one at a time, so only the set of names is
+        # kept, never every shard at once
+        unique_sysnames = set()
+        for sysnames in systems_with_new_data:
+            unique_sysnames.update(sysnames)
         if unique_sysnames:
-            self.ipl_data_ingestor.ingest_duration_data(unique_sysnames)
-        results = []
-        if dto.view_type == "done":
-            data = self.results_done_repo.get_all()
-            for item in data:
-                results.append(
-                    {
-                        "id": item.id,
-                        "sysname": item.sysname,
-                        "ipl_date": item.ipl_date,
-                        "log_dataset": item.log_dataset,
-                        "pre_ipl": item.pre_ipl,
-                        "shutdown_begin": item.shutdown_begin,
-                        "shutdown_end": item.shutdown_end,
-                        "ipl_begin": item.ipl_begin,
-                        "ipl_end": item.ipl_end,
-                        "pos_ipl": item.pos_ipl,
-                        "shutdown_duration": item.shutdown_duration,
-                        "poweroff_duration": item.poweroff_duration,
-                        "load_ipl": item.load_ipl,
-                        "total_duration": item.total_duration,
-                    }
-                )
-        elif dto.view_type == "fail":
-            data = self.results_fail_repo.get_all()
-            for item in data:
-                results.append(
-                    {
-                        "id": item.id,
-                        "sysname": item.sysname,
-                        "log_dataset": item.log_dataset,
-                        "pre_ipl": item.pre_ipl,
-                        "shutdown_begin": item.shutdown_begin,
-                        "shutdown_end": item.shutdown_end,
-                        "ipl_begin": item.ipl_begin,
-                        "ipl_end": item.ipl_end,
-                        "pos_ipl": item.pos_ipl,
-                    }
-                )
-        elif dto.view_type == "last_ipl":
-            data = self.results_last_ipl_repo.get_distinct_last_ipl_results()
-            for item in data:
-                results.append(
-                    {
-                        "sysname": item.sysname,
-                        "last_ipl": item.last_ipl,
-                    }
-                )
-        return results
+            self.ipl_data_ingestor.ingest_duration_data(list(unique_sysnames))
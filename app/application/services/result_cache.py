@@ -0,0 +1,66 @@
+"""
+Provides a small time-based cache for service results.
+
+Classes:
+    ResultCache: Holds the result of a loader for a fixed number of seconds.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultCache(Generic[T]):
+    """
+    Caches the result of a single loader call for a short time.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl (float): How long, in seconds, a loaded result is served.
+
+        Returns:
+            None
+        """
+
+        self.ttl = ttl
+        self._expires = 0.0
+        self._value: T | None = None
+        self._lock = threading.RLock()
+
+    def get(self, loader: Callable[[], T]) -> T:
+        """
+        Returns the cached result, calling the loader if it has expired.
+
+        Args:
+            loader (Callable[[], T]): Produces a fresh result.
+
+        Returns:
+            T: The cached or freshly loaded result.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            if self._expires > now:
+                return self._value
+            self._value = loader()
+            self._expires = now + self.ttl
+            return self._value
+
+    def clear(self) -> None:
+        """
+        Drops the cached result so the next get calls the loader.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._expires = 0.0
+            self._value = None
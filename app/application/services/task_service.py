@@ -4,11 +4,12 @@ and interacting with various services.
 """
 
 import asyncio
-import concurrent.futures
 import logging
 import os
+import shlex
 import shutil
 from collections.abc import Callable
+from dataclasses import asdict
 from typing import Any
 
 from app.application.dtos import (
@@ -17,17 +18,44 @@ from app.application.dtos import (
     ScheduleTaskDTO,
     TaskProgressDTO,
 )
+from app.application.services.result_cache import ResultCache
 from app.domain.repositories import ILparRepository
 from app.domain.services import (
     IDryRunExternalService,
     IExternalSSHService,
     ISchedulerService,
+    ISSHSession,
 )
 from app.infrastructure.config.settings import app_settings
 from app.infrastructure.external_apis.cirrus_client import CirrusClient
 
 logger = logging.getLogger(__name__)
 
+# The scheduler list page auto-refreshes; jobs only change when scheduled,
+# cleared or run
+SCHEDULED_TASKS_CACHE_TTL = 2.0
+
+# A deploy run emits about this many progress events, plus the final one,
+# however many LPARs it covers
+PROGRESS_EMIT_STEPS = 20
+
+# The project root, where the deploy scripts and the results directory live
+LOCAL_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../..")
+)
+SCRIPT_DIR = os.path.join(LOCAL_DIR, "scripts")
+SCRIPT_FILES = (
+    "ipld_calc.awk",
+    "ipld_parsing.awk",
+    "patterns",
+    "main.sh",
+    "methods.sh",
+)
+SCRIPT_FILE_PATHS = tuple(
+    (file_name, os.path.join(SCRIPT_DIR, file_name))
+    for file_name in SCRIPT_FILES
+)
+
 
 class TaskService:
     """
@@ -68,6 +96,9 @@ class TaskService:
         self.dryrun_ssh_service = dryrun_ssh_service
         self.scheduler_service = scheduler_service
         self.cirrus_client = cirrus_client
+        self._scheduled_tasks: ResultCache[list[dict[str, Any]]] = (
+            ResultCache(SCHEDULED_TASKS_CACHE_TTL)
+        )
         self.socketio_emitter: Callable | None
 
     def set_socketio_emitter(self, emitter_func: Callable) -> None:
@@ -99,29 +130,56 @@ class TaskService:
                 either "SUCCESS" or "ERROR".
         """
 
-        local_dir = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "../../.."
-        )
+        logger.info(f"Starting deploy loop for {lpar_hostname}")
+
+        # Every step below runs over this one connection instead of
+        # connecting and authenticating again for each command and file
+        try:
+            async with self.ssh_service.session(
+                lpar_hostname, username
+            ) as ssh:
+                return await self._run_deploy_steps(
+                    ssh, lpar_hostname, qualifier
+                )
+        except Exception:
+            logger.exception(f"Failed to connect to {lpar_hostname}")
+            return f"ERROR: An error occured connecting to {lpar_hostname}"
+
+    async def _run_deploy_steps(
+        self, ssh: ISSHSession, lpar_hostname: str, qualifier: str
+    ) -> str:
+        """
+        Runs the deploy steps for one LPAR over an open SSH session.
+
+        Parameters:
+            ssh (ISSHSession): The session connected to the LPAR.
+            lpar_hostname (str): The hostname of the LPAR.
+            qualifier (str): The qualifier to use for the deployment.
+
+        Returns:
+            str: The hostname on success, or a message starting with
+                "ERROR" naming the step that failed.
+        """
+
         lpar_name_prefix = lpar_hostname.split(".")[0]
         remote_tmp_path = f"{app_settings.ROOT_TMP_ANALYSIS}{lpar_name_prefix}"
+        # Every remote path and argument below is parsed by the remote shell
+        remote_dir = shlex.quote(remote_tmp_path)
+        remote_tmp_root = shlex.quote(app_settings.ROOT_TMP_ANALYSIS)
         local_results_path = os.path.join(
-            local_dir, app_settings.ROOT_RESULTS, lpar_name_prefix
+            LOCAL_DIR, app_settings.ROOT_RESULTS, lpar_name_prefix
         )
 
-        logger.info(f"Starting deploy loop for {lpar_hostname}")
-
         # 1. Prepare the remote temporary space
         prepare_command = (
-            f"if [[ -d {remote_tmp_path} ]]; then"
-            f"rm -rf {remote_tmp_path} && "
-            f"mkdir -p {remote_tmp_path}; fi;"
-            f"ls -la {remote_tmp_path}"
+            f"if [[ -d {remote_dir} ]]; then "
+            f"rm -rf {remote_dir}; fi; "
+            f"mkdir -p {remote_dir}; "
+            f"ls -la {remote_dir}"
         )
 
         try:
-            check_space_output = await self.ssh_service.run_command(
-                lpar_hostname, username, prepare_command
-            )
+            check_space_output = await ssh.run_command(prepare_command)
             logger.debug(
                 f"Remote space preparation output: {check_space_output}"
             )
@@ -132,45 +190,40 @@ class TaskService:
             return "ERROR: An error occured on prepare the remote file space"
 
         # 2. Upload the script files
-        files_to_load = [
-            "ipld_calc.awk",
-            "ipld_parsing.awk",
-            "patterns",
-            "main.sh",
-            "methods.sh",
-        ]
-        script_dir = os.path.join(local_dir, "scripts")
-
-        for file_to_load in files_to_load:
-            local_file_path = os.path.join(script_dir, file_to_load)
+        # Each upload runs on its own channel, so they can run together
+        upload_results = await asyncio.gather(
+            *(
+                ssh.upload_file(local_file_path, remote_dir)
+                for _, local_file_path in SCRIPT_FILE_PATHS
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                await self.ssh_service.upload_file(
-                    lpar_hostname, username, local_file_path, remote_tmp_path
-                )
-                logger.debug(
-                    f"Uploaded {file_to_load} to "
-                    f"  {lpar_hostname}:{remote_tmp_path}"
-                )
-            except Exception:
-                logger.exception(
-                    f"Failed to upload {file_to_load} to {lpar_hostname}"
+        for (file_to_load, _), upload_result in zip(
+            SCRIPT_FILE_PATHS, upload_results
+        ):
+            if isinstance(upload_result, Exception):
+                logger.error(
+                    f"Failed to upload {file_to_load} to {lpar_hostname}",
+                    exc_info=upload_result,
                 )
                 return (
                     "ERROR: An error occured on upload"
                     f"file {file_to_load.upper()} to {lpar_hostname}"
                 )
+            logger.debug(
+                f"Uploaded {file_to_load} to "
+                f"  {lpar_hostname}:{remote_tmp_path}"
+            )
 
         # 3. Execute main.sh on the remote server
         execute_command = (
-            f"{remote_tmp_path}/main.sh -r cli "
-            f"-a {lpar_hostname} -q {qualifier}"
+            f"{remote_dir}/main.sh -r cli "
+            f"-a {shlex.quote(lpar_hostname)} -q {shlex.quote(qualifier)}"
         )
 
         try:
-            execution_output = await self.ssh_service.run_command(
-                lpar_hostname, username, execute_command
-            )
+            execution_output = await ssh.run_command(execute_command)
             logger.info(
                 f"main.sh execution output for {lpar_hostname}: "
                 f"{execution_output[:200]}..."
@@ -180,17 +233,15 @@ class TaskService:
             return "ERROR: An error occured running the main.sh"
 
         # 4. Donwload CSV file results
+        shutil.rmtree(local_results_path, ignore_errors=True)
         os.makedirs(local_results_path, exist_ok=True)
-        if os.path.isdir(local_results_path):
-            shutil.rmtree(local_results_path)
-        os.makedirs(local_results_path)
 
-        remote_csv_path = f"{remote_tmp_path}/*.CSV"
+        # scp hands the path to the remote shell, so the glob is expanded
+        # there and every match comes back over one transfer
+        remote_csv_path = f"{remote_dir}/*.CSV"
 
         try:
-            await self.ssh_service.download_file(
-                lpar_hostname, username, remote_csv_path, local_results_path
-            )
+            await ssh.download_file(remote_csv_path, local_results_path)
             logger.info(
                 f"Downloaded CSV results from {lpar_hostname} "
                 f"to {local_results_path}"
@@ -203,16 +254,14 @@ class TaskService:
 
         # 5. Clean up remote temporary space
         cleanup_command = (
-            f"if [[ -d {remote_tmp_path} ]]; then"
-            f"rm -rf {remote_tmp_path}; fi; "
-            f"if [[ -d {app_settings.ROOT_TMP_ANALYSIS} ]]; then "
-            f"rm -rf {app_settings.ROOT_TMP_ANALYSIS}; fi"
+            f"if [[ -d {remote_dir} ]]; then "
+            f"rm -rf {remote_dir}; fi; "
+            f"if [[ -d {remote_tmp_root} ]]; then "
+            f"rm -rf {remote_tmp_root}; fi"
         )
 
         try:
-            await self.ssh_service.run_command(
-                lpar_hostname, username, cleanup_command
-            )
+            await ssh.run_command(cleanup_command)
             logger.info(f"Cleaned up remote space on {lpar_hostname}")
         except Exception:
             logger.exception(
@@ -233,94 +282,134 @@ class TaskService:
             None
         """
 
-        lpars_to_deploy = self.lpar_repo.find(
-            self.lpar_repo.model, in_values={"id": lpar_ids}
-        )
+        # One IN query, then plain tuples: the deploy loops never touch
+        # the ORM session or trigger attribute loads
+        deploy_args = [
+            (lpar.hostname, lpar.username, lpar.dataset)
+            for lpar in self.lpar_repo.get_many_by_ids(lpar_ids)
+        ]
 
-        if not lpars_to_deploy and self.socketio_emitter:
+        if not deploy_args and self.socketio_emitter:
             self.socketio_emitter(
                 "task_progress",
-                TaskProgressDTO(
-                    result=[],
-                    percent=100,
-                    error="No LPARs found for given IDs",
-                ).__dict__,
+                asdict(
+                    TaskProgressDTO(
+                        result=[],
+                        percent=100,
+                        error="No LPARs found for given IDs",
+                    )
+                ),
             )
             return
 
-        lpar_status = {lpar.hostname: "wait" for lpar in lpars_to_deploy}
+        lpar_status = dict.fromkeys(
+            (hostname for hostname, _, _ in deploy_args), "wait"
+        )
 
         if self.socketio_emitter:
             self.socketio_emitter(
                 "task_progress",
-                TaskProgressDTO(
-                    result=[f"'{h}': '{s}'" for h, s in lpar_status.items()],
-                    percent=10,
-                    error=None,
-                ).__dict__,
+                asdict(
+                    TaskProgressDTO(
+                        result=[
+                            f"'{h}': '{s}'" for h, s in lpar_status.items()
+                        ],
+                        percent=10,
+                        error=None,
+                    )
+                ),
             )
 
-        with (
-            concurrent.futures,
-            concurrent.futures.ThreadPoolExecutor(
-                max_workers=app_settings.THREAD_WORKS
-            ) as executor,
-        ):
-            futures = {
-                executor.submit(
-                    asyncio.run,
-                    self._deploy_lpar_loop(
-                        lpar.hostname, lpar.username, lpar.dataset
-                    ),
-                ): lpar.hostname
-                for lpar in lpars_to_deploy
-            }
+        asyncio.run(self._run_deploy_tasks_async(deploy_args, lpar_status))
 
-            completed_count = 0
-            total_tasks = len(futures)
-            errors = []
+    async def _run_deploy_tasks_async(
+        self,
+        deploy_args: list[tuple[str, str, str]],
+        lpar_status: dict[str, str],
+    ) -> None:
+        """
+        Runs the deploy loops of all LPARs on a single event loop.
 
-            for future in concurrent.futures.concurrent.futures.as_completed(
-                futures
-            ):
-                hostname = futures[future]
+        At most THREAD_WORKS deploy loops are in flight at a time. Progress
+        is emitted every few completions and once all of them are done.
+
+        Args:
+            deploy_args (list[tuple[str, str, str]]): The hostname, username
+                and dataset of every LPAR to deploy.
+            lpar_status (dict[str, str]): The status of every LPAR, keyed by
+                hostname. Updated in place as deployments finish.
+
+        Returns:
+            None
+        """
+
+        semaphore = asyncio.Semaphore(app_settings.THREAD_WORKS)
 
+        async def guarded_deploy(
+            hostname: str, username: str, dataset: str
+        ) -> tuple[str, str | Exception]:
+            async with semaphore:
                 try:
-                    result = future.result()
-                    if result.startswith("ERROR"):
-                        lpar_status[hostname] = "error"
-                        errors.append(
-                            f"Deployment failed for {hostname}: {result}"
-                        )
-                        logger.error(
-                            f"Deployment failed for {hostname}: {result}"
-                        )
-                    else:
-                        lpar_status[hostname] = "done"
-                        logger.info(f"Deployment successful for {hostname}")
-                except Exception as e:
-                    lpar_status[hostname] = "error"
-                    errors.append(
-                        f"Deployment failed for {hostname} with exception: {e}"
+                    result = await self._deploy_lpar_loop(
+                        hostname, username, dataset
                     )
+                except Exception as e:
                     logger.exception(f"Deployment failed for {hostname}")
+                    return hostname, e
+                return hostname, result
 
-                completed_count += 1
-                percent = (completed_count / total_tasks) * 100
+        tasks = [
+            asyncio.create_task(guarded_deploy(hostname, username, dataset))
+            for hostname, username, dataset in deploy_args
+        ]
 
-                if self.socketio_emitter:
-                    self.socketio_emitter(
-                        "task_progress",
+        completed_count = 0
+        total_tasks = len(tasks)
+        emit_every = max(1, total_tasks // PROGRESS_EMIT_STEPS)
+        errors = []
+        # One preformatted line per LPAR; a completion only rewrites its own
+        index_of = {hostname: i for i, hostname in enumerate(lpar_status)}
+        progress_lines = [f"'{h}': '{s}'" for h, s in lpar_status.items()]
+
+        for next_done in asyncio.as_completed(tasks):
+            hostname, result = await next_done
+
+            if isinstance(result, Exception):
+                lpar_status[hostname] = "error"
+                errors.append(
+                    f"Deployment failed for {hostname} with exception: "
+                    f"{result}"
+                )
+            elif result.startswith("ERROR"):
+                lpar_status[hostname] = "error"
+                errors.append(f"Deployment failed for {hostname}: {result}")
+                logger.error(f"Deployment failed for {hostname}: {result}")
+            else:
+                lpar_status[hostname] = "done"
+                logger.info(f"Deployment successful for {hostname}")
+
+            progress_lines[index_of[hostname]] = (
+                f"'{hostname}': '{lpar_status[hostname]}'"
+            )
+            completed_count += 1
+            percent = (completed_count / total_tasks) * 100
+
+            if self.socketio_emitter and (
+                completed_count % emit_every == 0
+                or completed_count == total_tasks
+            ):
+                self.socketio_emitter(
+                    "task_progress",
+                    asdict(
                         TaskProgressDTO(
-                            result=[
-                                f"'{h}': '{s}'" for h, s in lpar_status.items()
-                            ],
+                            result=progress_lines,
                             percent=percent,
                             error=", ".join(errors) if errors else None,
-                        ).__dict__,
-                    )
+                        )
+                    ),
+                )
 
-                logger.info("All deployments tasks completed")
+        logger.info("All deployments tasks completed")
 
     async def _perform_dry_run_checks(
         self, hostname: str, username: str, dataset: str
@@ -338,7 +427,7 @@ class TaskService:
 
         status = DryRunStatusDTO()
         if self.socketio_emitter:
-            self.socketio_emitter("dry_run", status.__dict__)
+            self.socketio_emitter("dry_run", asdict(status))
 
         try:
             # 1. Check Egress Firewall Rules
@@ -346,7 +435,7 @@ class TaskService:
             status.firewall_rules = "done" if firewall_ok else "error"
 
             if self.socketio_emitter:
-                self.socketio_emitter("dry_run", status.__dict__)
+                self.socketio_emitter("dry_run", asdict(status))
 
             if not firewall_ok:
                 logger.warning(
@@ -377,7 +466,7 @@ class TaskService:
                 status.check_tmp_space = "error"
 
             if self.socketio_emitter:
-                self.socketio_emitter("dry_run", status.__dict__)
+                self.socketio_emitter("dry_run", asdict(status))
 
         except Exception:
             logger.exception(
@@ -389,7 +478,7 @@ class TaskService:
             status.check_tmp_space = "error"
 
             if self.socketio_emitter:
-                self.socketio_emitter("dry_run", status.__dict__)
+                self.socketio_emitter("dry_run", asdict(status))
 
     def run_dry_run(self, dto: DryRunRequestDTO) -> None:
         """
@@ -403,20 +492,26 @@ class TaskService:
             None
         """
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=app_settings.THREAD_WORKS
-        ) as executor:
-            future = executor.submit(
-                asyncio.run,
-                self._perform_dry_run_checks(
-                    dto.hostname, dto.username, dto.dataset
-                ),
-            )
+        asyncio.run(self.run_dry_run_async(dto))
 
-            try:
-                future.result()
-            except Exception:
-                logger.exception("Dry run execution failed")
+    async def run_dry_run_async(self, dto: DryRunRequestDTO) -> None:
+        """
+        Run a dry run on the specified dataset, on the caller's event loop.
+
+        Args:
+            dto (DryRunRequestDTO): The request data transfer object
+                containing the hostname, username, and dataset name.
+
+        Returns:
+            None
+        """
+
+        try:
+            await self._perform_dry_run_checks(
+                dto.hostname, dto.username, dto.dataset
+            )
+        except Exception:
+            logger.exception("Dry run execution failed")
 
     def _threaded_deploy_task(
         self, lpar_hostname: str, username: str, qualifier: str
@@ -468,6 +563,7 @@ class TaskService:
             username=lpar.username,
             qualifier=lpar.dataset,
         )
+        self._scheduled_tasks.clear()
         logger.info(
             f"Scheduled task for LPAR {lpar.lpar} at {dto.schedule_time} "
             f"on {dto.day_of_week or 'every_day'}"
@@ -494,7 +590,7 @@ class TaskService:
                 kwargs (dict[str, Any]): A dictionary of keyword arguments
                     to be passed to the function when it is executed.
         """
-        return self.scheduler_service.get_all_jobs()
+        return self._scheduled_tasks.get(self.scheduler_service.get_all_jobs)
 
     def clear_scheduled_tasks(self, tag: str | None) -> None:
         """
@@ -509,3 +605,4 @@ class TaskService:
         """
 
         self.scheduler_service.clear_jobs(tag)
+        self._scheduled_tasks.clear()
@@ -45,3 +45,22 @@ class DryRunCheckUseCase:
         self.task_service.set_socketio_emitter(socketio_emitter)
 
         self.task_service.run_dry_run(dto)
+
+    async def execute_async(
+        self, dto: DryRunRequestDTO, socketio_emitter: Callable
+    ) -> None:
+        """
+        Executes a dry run on the running event loop.
+
+        Parameters:
+        - dto (DryRunRequestDTO): The request data for the dry run.
+        - socketio_emitter (Callable): A function that emits events to
+            the client using Socket.IO.
+
+        Returns:
+        None
+        """
+
+        self.task_service.set_socketio_emitter(socketio_emitter)
+
+        await self.task_service.run_dry_run_async(dto)
@@ -5,7 +5,7 @@ Defines data entities used throughout the application.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Represents a user in the system.
@@ -19,7 +19,7 @@ class User:
     approved: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Lpar:
     """
     Represents an LPAR (Logical Parition) on z/OS
@@ -34,7 +34,7 @@ class Lpar:
     schedule: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VaultEntry:
     """
     Represents an SSH key entry in the vault.
@@ -46,7 +46,7 @@ class VaultEntry:
     public_key: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IPLResultDone:
     """
     Represents a successful IPL analysis result.
@@ -68,7 +68,7 @@ class IPLResultDone:
     total_duration: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IPLResultFail:
     """
     Represents the failed IPL analysis result.
@@ -85,7 +85,7 @@ class IPLResultFail:
     pos_ipl: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IPLResultLast:
     """
     Represents the last IPL analysis result for a system.
@@ -116,6 +116,32 @@ class IUserRepository(IRepository):
         """
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, user_ids: list[int]) -> list[T]:
+        """
+        Get several users in a single query.
+
+        Args:
+            user_ids (list[int]): The IDs of the users to retrieve.
+
+        Returns:
+            list[T]: The users found, in no particular order.
+        """
+        pass
+
+    @abstractmethod
+    def update_many(self, users: list[T]) -> list[T]:
+        """
+        Persists changes to several users in a single transaction.
+
+        Args:
+            users (list[T]): The modified users.
+
+        Returns:
+            list[T]: The updated users.
+        """
+        pass
+
 
 class ILparRepository(IRepository):
     """
@@ -132,6 +158,19 @@ class ILparRepository(IRepository):
         """
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, lpar_ids: list[int]) -> list[T]:
+        """
+        Retrieves several LPARs in a single query.
+
+        Args:
+            lpar_ids (list[int]): The IDs of the LPARs to retrieve.
+
+        Returns:
+            list[T]: The LPARs found, in no particular order.
+        """
+        pass
+
 
 class IVaultRepository(IRepository):
     """Interface for interacting with a vault repository.
@@ -171,6 +210,16 @@ class IResultsDoneRepository(IRepository):
         """
         pass
 
+    @abstractmethod
+    def get_results_done_version(self) -> tuple[Any, ...]:
+        """
+        Returns a token that changes whenever the results done change.
+
+        Returns:
+            A tuple identifying the current content of the repository.
+        """
+        pass
+
 
 class IResultsFailRepository(IRepository):
     """
@@ -191,6 +240,16 @@ class IResultsFailRepository(IRepository):
         """
         pass
 
+    @abstractmethod
+    def get_results_fail_version(self) -> tuple[Any, ...]:
+        """
+        Returns a token that changes whenever the failed results change.
+
+        Returns:
+            A tuple identifying the current content of the repository.
+        """
+        pass
+
 
 class IResultsLastIplRepository(IRepository):
     """
@@ -206,3 +265,13 @@ class IResultsLastIplRepository(IRepository):
             A list of all last IPL results.
         """
         pass
+
+    @abstractmethod
+    def get_last_ipl_results_version(self) -> tuple[Any, ...]:
+        """
+        Returns a token that changes whenever the last IPL results change.
+
+        Returns:
+            A tuple identifying the current content of the repository.
+        """
+        pass
@@ -4,11 +4,20 @@ Provides various utility services for the application.
 
 import hashlib
 import hmac
-import os
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
+import argon2
+
+# Argon2id parameters: the RFC 9106 second recommended option (64 MiB).
+# They are fixed rather than derived from the host's CPU count, so every
+# server produces and accepts the same hashes without rehashing them.
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536
+ARGON2_PARALLELISM = 4
+
 
 class IPasswordHasher(ABC):
     """
@@ -18,7 +27,7 @@ class IPasswordHasher(ABC):
     @abstractmethod
     def hash_password(self, password: str, salt: bytes | None = None) -> str:
         """
-        Hashes a password using the SHA-256 algorithm.
+        Hashes a password.
 
         Args:
             password (str): The password to be hashed.
@@ -26,7 +35,7 @@ class IPasswordHasher(ABC):
                 process. Defaults to None.
 
         Returns:
-            str: The hashed password as a hexadecimal string.
+            str: The encoded hash, ready to be stored.
         """
         pass
 
@@ -47,29 +56,62 @@ class IPasswordHasher(ABC):
         """
         pass
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Check if a stored hash should be replaced by a fresh one.
+
+        Args:
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the hash uses an outdated algorithm or
+                parameters. Defaults to False.
+        """
+        return False
+
 
 class PasswordHasher(IPasswordHasher):
-    """Hashing passwords using PBKDF2 with a random salt."""
+    """Hashing passwords using Argon2id.
+
+    Hashes stored before the switch are hex-encoded PBKDF2 salt + key pairs.
+    They are still verified, and needs_rehash reports them so they are
+    replaced on the next successful login.
+    """
 
     def __init__(
-        self, method: str = "sha256", iterations: int = 100000
+        self,
+        method: str = "sha256",
+        iterations: int = 100000,
+        time_cost: int = ARGON2_TIME_COST,
+        memory_cost: int = ARGON2_MEMORY_COST,
+        parallelism: int = ARGON2_PARALLELISM,
     ) -> None:
         """
         Initialize the hash object.
 
         Args:
-            method (str): The hashing algorithm to use. Default is "sha256".
-            iterations (int): The number of iterations to perform.
+            method (str): The digest of legacy PBKDF2 hashes.
+                Default is "sha256".
+            iterations (int): The iterations of legacy PBKDF2 hashes.
                 Default is 100000.
+            time_cost (int): The number of Argon2 passes.
+            memory_cost (int): The Argon2 memory usage, in KiB.
+            parallelism (int): The number of Argon2 lanes.
 
         Returns:
             None
         """
         self.method = method
         self.iterations = iterations
+        self._argon2 = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
 
     def hash_password(self, password: str, salt: bytes | None = None) -> str:
-        """Hash a password using PBKDF2 with the given parameters.
+        """Hash a password using Argon2id.
 
         Args:
             password (str): The password to be hashed.
@@ -77,16 +119,11 @@ class PasswordHasher(IPasswordHasher):
                 If not provided, a random salt will be generated.
 
         Returns:
-            str: The hexadecimal representation of the hashed password.
+            str: The encoded hash, "$argon2id$..." with its salt and
+                parameters.
         """
 
-        if salt is None:
-            salt = os.urandom(16)
-        key = hashlib.pbkdf2_hmac(
-            self.method, password.encode("utf-8"), salt, self.iterations
-        )
-        generated_password = salt + key
-        return generated_password.hex()
+        return self._argon2.hash(password, salt=salt)
 
     def check_password(
         self, plain_password: str, hashed_password: str
@@ -95,16 +132,57 @@ class PasswordHasher(IPasswordHasher):
 
         Args:
             plain_password (str): The plain text password to check.
-            hashed_password (str): The hashed password to compare against.
+            hashed_password (str): The hashed password to compare against,
+                either Argon2 or legacy hex-encoded PBKDF2.
 
         Returns:
             bool: True if the password matches, False otherwise.
+        """
 
-        Raises:
-            ValueError: If either the plain or hashed password is empty.
+        if not hashed_password.startswith("$argon2"):
+            return self._check_legacy_password(
+                plain_password, hashed_password
+            )
+        try:
+            return self._argon2.verify(hashed_password, plain_password)
+        except (
+            argon2.exceptions.VerificationError,
+            argon2.exceptions.InvalidHashError,
+        ):
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check if a stored hash is legacy PBKDF2 or uses old parameters.
+
+        Args:
+            hashed_password (str): The stored hash.
+
+        Returns:
+            bool: True if the hash should be replaced, False otherwise.
         """
 
-        hashed_password_bytes = bytes.fromhex(hashed_password)
+        if not hashed_password.startswith("$argon2"):
+            return True
+        return self._argon2.check_needs_rehash(hashed_password)
+
+    def _check_legacy_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Check a password against a hex-encoded PBKDF2 salt + key hash.
+
+        Args:
+            plain_password (str): The plain text password to check.
+            hashed_password (str): The legacy hash.
+
+        Returns:
+            bool: True if the password matches, False otherwise.
+        """
+
+        try:
+            hashed_password_bytes = memoryview(bytes.fromhex(hashed_password))
+        except ValueError:
+            return False
+        # Views into the decoded hash: the salt and key are not copied
         salt = hashed_password_bytes[:16]
         stored_key = hashed_password_bytes[16:]
         new_key = hashlib.pbkdf2_hmac(
@@ -113,9 +191,61 @@ class PasswordHasher(IPasswordHasher):
         return hmac.compare_digest(stored_key, new_key)
 
 
+class ISSHSession(ABC):
+    """Interface for an SSH connection to a single host."""
+
+    @abstractmethod
+    async def run_command(self, command: str) -> str:
+        """Run a command on the connected host.
+
+        Args:
+            command (str): The command to run on the remote host.
+
+        Returns:
+            str: The output of the command as a string.
+        """
+        pass
+
+    @abstractmethod
+    async def upload_file(self, local_path: str, remote_path: str) -> None:
+        """Upload a file to the connected host.
+
+        Args:
+            local_path (str): The path to the local file to upload.
+            remote_path (str): The destination path on the remote host.
+        """
+        pass
+
+    @abstractmethod
+    async def download_file(self, remote_path: str, local_path: str) -> None:
+        """Download a file from the connected host.
+
+        Args:
+            remote_path (str): The source path on the remote host.
+            local_path (str): The destination path on the local machine.
+        """
+        pass
+
+
 class IExternalSSHService(ABC):
     """Interface for SSH services."""
 
+    @abstractmethod
+    def session(
+        self, host: str, username: str
+    ) -> AbstractAsyncContextManager[ISSHSession]:
+        """Open one SSH connection to be shared by several operations.
+
+        Args:
+            host (str): The hostname or IP address of the remote host.
+            username (str): The username to use for authentication.
+
+        Returns:
+            AbstractAsyncContextManager[ISSHSession]: Yields the connected
+                session, and closes the connection on exit.
+        """
+        pass
+
     @abstractmethod
     async def run_command(self, host: str, username: str, command: str) -> str:
         """Run a command on a remote host via SSH.
@@ -18,6 +18,7 @@ class AppSettings(BaseSettings):
     """Represents a configuration object for the application."""
 
     THREAD_WORKS: int = 60
+    DEPLOY_POOL_SIZE: int = 4
     RESULT_PATH: str
     ZPLATIPLD_DB: str
     ZPLATIPLD_URL_DB: str
@@ -43,12 +44,16 @@ class AppSettings(BaseSettings):
         Attributes:
             env_file (str): The name of the environment file to use.
             Default is ".env".
+            frozen (bool): Settings are validated once at import and are
+            read-only afterwards, so values derived from them can be
+            computed once.
 
         """
 
         env_file = "../.env"
         env_file_encoding = "utf-8"
         case_sensitive = True
+        frozen = True
 
 
 app_settings = AppSettings()
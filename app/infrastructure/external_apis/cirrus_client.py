@@ -4,11 +4,27 @@ Provides an implementation for interacting with Cirrus CI API.
 
 import base64
 import socket
+import threading
+import time
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.infrastructure.config.settings import app_settings
 
+# Access tokens are reused until this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 30.0
+# Lifetime assumed when the token response carries no expires_in
+DEFAULT_TOKEN_TTL = 300.0
+# Kept-alive connections to the Cirrus API, shared by concurrent checks
+HTTP_POOL_SIZE = 16
+# Resolved LPAR addresses are reused for this many seconds
+DNS_CACHE_TTL = 300.0
+DNS_CACHE_MAXSIZE = 1024
+# The cluster's egress rules are fetched again after this many seconds
+EGRESS_CACHE_TTL = 60.0
+
 
 class CirrusClient:
     """
@@ -20,6 +36,8 @@ class CirrusClient:
             the authentication server.
         egress_rules_url (str): URL for retrieving egress rules from
             the Cirrus API.
+        cluster_egress_url (str): URL of the configured cluster, whose
+            egress rules the firewall check reads.
     """
 
     def __init__(self) -> None:
@@ -38,6 +56,30 @@ class CirrusClient:
             f"{self.settings.CIRRUS_API_VERSION}/"
             f"{self.settings.CIRRUS_ENDPOINT_FIREWALL}"
         )
+        # The credentials are frozen settings, so the header is built once
+        self._auth_headers = self._get_auth_headers()
+        # (token, monotonic time after which it is fetched again)
+        self._token: tuple[str, float] | None = None
+        self._token_lock = threading.Lock()
+        # One pooled session: calls reuse open TLS connections instead of
+        # handshaking again for every request
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE),
+        )
+        # hostname -> (IPv4 address, monotonic expiry)
+        self._addresses: dict[str, tuple[str, float]] = {}
+        self._addresses_lock = threading.Lock()
+        self.cluster_egress_url = (
+            f"{self.settings.CIRRUS_API_URL}/"
+            f"{self.settings.CIRRUS_API_VERSION}/"
+            f"{self.settings.CIRRUS_PROJECT_ID}/"
+            f"{self.settings.CIRRUS_CLUSTER_ID}"
+        )
+        # (egress destination IPs, monotonic expiry)
+        self._egress: tuple[frozenset[str], float] | None = None
+        self._egress_lock = threading.Lock()
 
     def _get_auth_headers(self) -> dict[str, str]:
         """
@@ -55,6 +97,9 @@ class CirrusClient:
     def _get_access_token(self) -> str:
         """Gets an access token from the authentication server.
 
+        The token is cached until shortly before it expires, and concurrent
+        callers wait for a single request instead of each fetching one.
+
         Args:
             self (class instance): The class instance that calls this method.
 
@@ -66,11 +111,100 @@ class CirrusClient:
                 server fails.
         """
 
-        headers = self._get_auth_headers()
-        response = requests.post(self.token_url, headers=headers, timeout=10)
+        with self._token_lock:
+            if self._token and time.monotonic() < self._token[1]:
+                return self._token[0]
+
+            response = self._session.post(
+                self.token_url, headers=self._auth_headers, timeout=10
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            expires_in = float(data.get("expires_in", DEFAULT_TOKEN_TTL))
+            self._token = (
+                data["access_token"],
+                time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN,
+            )
+            return self._token[0]
+
+    def _clear_access_token(self) -> None:
+        """Drops the cached access token, so the next call fetches one."""
+
+        with self._token_lock:
+            self._token = None
+
+    def _resolve(self, hostname: str) -> str:
+        """Resolves a hostname to its IPv4 address, caching the result.
+
+        Args:
+            hostname (str): The hostname to resolve.
+
+        Returns:
+            str: The IPv4 address of the host.
+
+        Raises:
+            socket.gaierror: If the hostname cannot be resolved.
+        """
+
+        now = time.monotonic()
+        with self._addresses_lock:
+            cached = self._addresses.get(hostname)
+            if cached and cached[1] > now:
+                return cached[0]
+
+        # Resolved outside the lock, so a slow lookup never holds up the
+        # checks of other hosts
+        address = socket.gethostbyname(hostname)
+        with self._addresses_lock:
+            if len(self._addresses) >= DNS_CACHE_MAXSIZE:
+                self._addresses.clear()
+            self._addresses[hostname] = (address, now + DNS_CACHE_TTL)
+        return address
+
+    def _fetch_egress_ips(self) -> frozenset[str]:
+        """Fetches the destination IPs of the cluster's egress rules.
+
+        Returns:
+            frozenset[str]: The destination IP of every egress rule.
+
+        Raises:
+            requests.exceptions.RequestException: If an error occurs
+                while making the HTTP request.
+        """
+
+        headers = {"Authorization": f"Bearer {self._get_access_token()}"}
+        response = self._session.get(
+            self.cluster_egress_url, headers=headers, timeout=10
+        )
+        if response.status_code == 401:
+            # The cached token was revoked early: fetch a new one, once
+            self._clear_access_token()
+            headers = {"Authorization": f"Bearer {self._get_access_token()}"}
+            response = self._session.get(
+                self.cluster_egress_url, headers=headers, timeout=10
+            )
         response.raise_for_status()
-        data = response.json()
-        return data["access_token"]
+        data = orjson.loads(response.content)
+        return frozenset(
+            egress["destination_ip"]
+            for egress in data.get("egress", [])
+            if "destination_ip" in egress
+        )
+
+    def _get_egress_ips(self) -> frozenset[str]:
+        """Returns the egress destination IPs, fetched at most once every
+        EGRESS_CACHE_TTL seconds.
+
+        Returns:
+            frozenset[str]: The destination IP of every egress rule.
+        """
+
+        with self._egress_lock:
+            if self._egress and time.monotonic() < self._egress[1]:
+                return self._egress[0]
+            egress_ips = self._fetch_egress_ips()
+            self._egress = (egress_ips, time.monotonic() + EGRESS_CACHE_TTL)
+            return egress_ips
 
     def check_egress_firewall(self, lpar_hostname: str) -> bool:
         """
@@ -87,22 +221,4 @@ class CirrusClient:
                 while making the HTTP request.
         """
 
-        lpar_ip_address = socket.gethostbyname(lpar_hostname)
-        access_token = self._get_access_token
-
-        headers = {"Authorization": f"Bearer {access_token}"}
-        egress_rules_url = (
-            f"{self.settings.CIRRUS_API_URL}/"
-            f"{self.settings.CIRRUS_API_VERSION}/"
-            f"{self.settings.CIRRUS_PROJECT_ID}/"
-            f"{self.settings.CIRRUS_CLUSTER_ID}"
-        )
-
-        response = requests.get(egress_rules_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        for egress in data.get("egress", []):
-            if egress.get("destination_ip") == lpar_ip_address:
-                return True
-        return False
+        return self._resolve(lpar_hostname) in self._get_egress_ips()
@@ -29,6 +29,8 @@ class IPLDataIngestor:
             f"{app_settings.RESULT_PATH}/{app_settings.ZPLATIPLD_DB}"
         )
         self.raw_result_table = "raw_results"
+        # Newest results directory mtime already ingested by this process
+        self._ingested_mtime: float | None = None
 
     def _get_connection(self) -> sqlite3.Connection:
         """
@@ -65,6 +67,47 @@ class IPLDataIngestor:
                     csv_files[file] = full_path
         return csv_files
 
+    def _results_mtime(self) -> float:
+        """Returns the newest modification time of the results directory and
+        of the per-LPAR directories right below it.
+
+        A deploy recreates an LPAR's directory and downloads its CSV files
+        into it, which updates these directories, so the files themselves
+        are never walked.
+
+        Returns:
+            float: The newest st_mtime, or 0.0 when there is no results
+                directory.
+        """
+        try:
+            latest = os.stat(app_settings.ROOT_RESULTS).st_mtime
+            with os.scandir(app_settings.ROOT_RESULTS) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            latest = max(latest, entry.stat().st_mtime)
+                    except FileNotFoundError:
+                        # Swapped out by a deploy meanwhile
+                        continue
+        except FileNotFoundError:
+            return 0.0
+        return latest
+
+    def is_stale(self) -> bool:
+        """Check if there may be result CSV files that were not ingested yet.
+
+        Only the results directories are stat'ed, which is far cheaper than
+        walking the files or the ingestion itself.
+
+        Returns:
+            bool: True if nothing was ingested yet or a results directory
+                changed since the last ingestion, False otherwise.
+        """
+        return (
+            self._ingested_mtime is None
+            or self._results_mtime() > self._ingested_mtime
+        )
+
     def _is_datetime(self, date_str: str | None) -> bool:
         """Check if a string is a valid datetime.
 
@@ -324,6 +367,8 @@ class IPLDataIngestor:
                 )
 
     def ingest_raw_ipl_data(self) -> list[list[str]]:
+        # Taken before reading, so files that land meanwhile stay stale
+        results_mtime = self._results_mtime()
         systems_with_new_data = []
         with self._get_connection() as connection:
             cursor = connection.cursor()
@@ -336,3 +381,6 @@ class IPLDataIngestor:
             """)
 
             connection.commit()
+
+        self._ingested_mtime = results_mtime
+        return systems_with_new_data
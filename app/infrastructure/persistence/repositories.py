@@ -5,7 +5,8 @@ in the application's database.
 
 from typing import Any
 
-from sqlalchemy import and_, create_engine
+from sqlalchemy import and_, create_engine, event, func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
@@ -21,6 +22,34 @@ from app.infrastructure.persistence.models import (
     VaultModel,
 )
 
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# writer and NORMAL sync fsyncs once per checkpoint instead of per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Applies SQLITE_PRAGMAS to a new DBAPI connection.
+
+    Args:
+        dbapi_connection (Any): The raw sqlite3 connection.
+        connection_record (Any): The pool record of the connection.
+
+    Returns:
+        None
+    """
+
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class SQLAlchemyRepository:
     """
@@ -39,6 +68,8 @@ class SQLAlchemyRepository:
             None
         """
         self.engine = create_engine(db_url)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", set_sqlite_pragmas)
         session = sessionmaker(bind=self.engine)
         self.session = session()
 
@@ -119,6 +150,57 @@ class SQLAlchemyRepository:
                 query = query.filter(getattr(model, field).in_(values))
         return query.all()
 
+    def read_rows(
+        self,
+        model: type[Base],
+        columns: tuple[str, ...] | None = None,
+        distinct: bool = False,
+    ) -> list[Row]:
+        """
+        Reads plain rows of column values, without building ORM objects.
+
+        Every requested column is loaded by the query itself, so reading
+        the rows never triggers further SELECTs. All rows are fetched at
+        once: the repository session is shared, so a result left open
+        for streaming would hold its cursor across requests.
+
+        Args:
+            model (type[Base]): The model class to query.
+            columns (tuple[str, ...] | None): The names of the columns to
+                load. Defaults to every column of the table.
+            distinct (bool): Whether to drop duplicate rows.
+
+        Returns:
+            list[Row]: The rows, whose values are read by column name.
+        """
+
+        table_columns = model.__table__.columns
+        statement = select(
+            *(
+                table_columns
+                if columns is None
+                else [table_columns[name] for name in columns]
+            )
+        )
+        if distinct:
+            statement = statement.distinct()
+        return self.session.execute(statement).all()
+
+    def read_version(self, model: type[Base]) -> tuple[Any, ...]:
+        """
+        Reads a cheap version token of a table, its highest id and its row
+        count, which changes whenever rows are added or removed.
+
+        Args:
+            model (type[Base]): The model class to query.
+
+        Returns:
+            tuple[Any, ...]: The highest id and the number of rows.
+        """
+
+        statement = select(func.max(model.id), func.count())
+        return tuple(self.session.execute(statement).one())
+
     def update(
         self,
         model: type[Base],
@@ -187,6 +269,12 @@ class LparRepository(SQLAlchemyRepository):
         super().__init__(db_url)
         self.model = LparModel
 
+    def get_many_by_ids(
+        self,
+        lpar_ids: list[int],
+    ) -> list[Base]:
+        return self.read(self.model, in_values={"id": lpar_ids})
+
 
 class UserRepository(SQLAlchemyRepository):
     """
@@ -216,6 +304,26 @@ class UserRepository(SQLAlchemyRepository):
     ) -> list[Base]:
         return self.read(self.model, criteria={"username": username})
 
+    def get_many_by_ids(
+        self,
+        user_ids: list[int],
+    ) -> list[Base]:
+        return self.read(self.model, in_values={"id": user_ids})
+
+    def update_many(
+        self,
+        users: list[Base],
+    ) -> list[Base]:
+        # One flush for every changed user: rows with the same changed
+        # columns go out as a single executemany UPDATE, then one commit
+        self.session.add_all(users)
+        try:
+            self.session.commit()
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+        return users
+
     def get_all(self) -> list:
         return self.read(self.model)
 
@@ -240,6 +348,12 @@ class ResultsDoneRepository(SQLAlchemyRepository):
         super().__init__(db_url)
         self.model = ResultsDoneTableModel
 
+    def get_all_results_done(self) -> list[Row]:
+        return self.read_rows(self.model)
+
+    def get_results_done_version(self) -> tuple[Any, ...]:
+        return self.read_version(self.model)
+
 
 class ResultsFailRepository(SQLAlchemyRepository):
     """
@@ -251,6 +365,12 @@ class ResultsFailRepository(SQLAlchemyRepository):
         super().__init__(db_url)
         self.model = ResultsFailTableModel
 
+    def get_all_results_fail(self) -> list[Row]:
+        return self.read_rows(self.model)
+
+    def get_results_fail_version(self) -> tuple[Any, ...]:
+        return self.read_version(self.model)
+
 
 class ResultsLastIplRepository(SQLAlchemyRepository):
     """
@@ -262,6 +382,14 @@ class ResultsLastIplRepository(SQLAlchemyRepository):
         super().__init__(db_url)
         self.model = ResultsLastIplTableModel
 
+    def get_all_last_ipl_results(self) -> list[Row]:
+        return self.read_rows(
+            self.model, columns=("sysname", "last_ipl"), distinct=True
+        )
+
+    def get_last_ipl_results_version(self) -> tuple[Any, ...]:
+        return self.read_version(self.model)
+
 
 class ResultsGarbRepository(SQLAlchemyRepository):
     """
@@ -31,6 +31,8 @@ class AsyncSSHClient:
         connect(self) -> asyncssh.SSHClientConnection: Connect to
             the SSH server and return a connected client.
         close(self) -> None: Close the connection.
+        __aenter__(self) -> AsyncSSHClient: Connect and keep the connection
+            open for every operation until the block exits.
         run_command(self, command: str) -> str: Runs a command on
             the SSH connection and returns the output as a string.
         upload_file(self, local_path: str, remote_path: str) -> None: Upload a
@@ -60,6 +62,7 @@ class AsyncSSHClient:
         self.username = username
         self.connection: asyncssh.SSHClientConnection | None = None
         self.vault_repo = vault_repo
+        self._keep_open = False
 
     async def _get_private_key_path(self) -> str:
         """
@@ -127,15 +130,15 @@ class AsyncSSHClient:
             Exception: If there is an error connecting to the SSH server.
         """
 
-        if not self.connect:
+        if self.connection is None:
             key_path = await self._get_private_key_path()
-            self._connect = await asyncssh.connect(
+            self.connection = await asyncssh.connect(
                 self.host,
                 username=self.username,
                 client_keys=[key_path],
                 known_hosts=None,
             )
-        return self._connect
+        return self.connection
 
     async def close(self) -> None:
         """
@@ -147,8 +150,42 @@ class AsyncSSHClient:
         Returns:
             None
         """
-        if self._connect:
-            self._connect.close()
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    async def _release(self) -> None:
+        """
+        Close the connection after an operation, unless it is shared by
+        an open session.
+
+        Returns:
+            None
+        """
+        if not self._keep_open:
+            await self.close()
+
+    async def __aenter__(self) -> "AsyncSSHClient":
+        """
+        Connect once and keep the connection open for every operation run
+        inside the block.
+
+        Returns:
+            AsyncSSHClient: This client, connected.
+        """
+        await self.connect()
+        self._keep_open = True
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """
+        Close the shared connection.
+
+        Returns:
+            None
+        """
+        self._keep_open = False
+        await self.close()
 
     async def run_command(self, command: str) -> str:
         """
@@ -172,7 +209,7 @@ class AsyncSSHClient:
             )
             return result.stdout.strip()
         finally:
-            await self.close()
+            await self._release()
 
     async def upload_file(self, local_path: str, remote_path: str) -> None:
         """
@@ -189,7 +226,7 @@ class AsyncSSHClient:
         try:
             await asyncssh.scp(local_path, (connection, f"{remote_path}"))
         finally:
-            await self.close()
+            await self._release()
 
     async def download_file(self, remote_path: str, local_path: str) -> None:
         """
@@ -206,4 +243,4 @@ class AsyncSSHClient:
         try:
             await asyncssh.scp((connection, f"{remote_path}"), local_path)
         finally:
-            await self.close()
+            await self._release()
@@ -68,6 +68,10 @@ app = Flask(__name__)
 app.config["SECRET_KEY"] = app_settings.SECRET_KEY
 app.config["ENVIRONMENT"] = app_settings.ENVIRONMENT
 app.template_folder = os.path.join(os.path.dirname(__file__), "../templates")
+# Templates only change on deploy: no per-render stat/reload check, and keep
+# every compiled template in memory
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_options = {**app.jinja_options, "cache_size": -1}
 socketio = SocketIO(app)
 csrf = CSRFProtect(app)
 login_manager = LoginManager()
@@ -97,6 +101,9 @@ class SSHServiceAdapter(IExternalSSHService):
     ) -> None:
         self._async_ssh_client_factory = async_ssh_client_factory
 
+    def session(self, host: str, username: str) -> AsyncSSHClient:
+        return self._async_ssh_client_factory(host, username)
+
     async def run_command(self, host: str, username: str, command: str) -> str:
         client = self._async_ssh_client_factory(host, username)
         return await client.run_command(command)
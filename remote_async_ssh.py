@@ -13,18 +13,31 @@ Usage:
     To use the RemoteSSHConnection class, create an instance of the class with 
     the hostname and username of the remote server, and then call the desired methods 
     on the instance to establish a connection, run commands, and transfer files.
+
+    Used as an async context manager, a single SSH connection is opened on entry
+    and shared by every command and transfer until the block exits:
+
+        async with RemoteSSHConnection(host, username) as ssh_client:
+            await ssh_client.run_command("ls")
 """
 
 import os
 import re
 import asyncssh
-import asyncssh.scp
 # from database import Database
 from sqlalchemy_sqlite import CrudDB, Vault
 
 RESULT_PATH = "/zplatipld/database"
 ZPLATIPLD_DB = "zplatipld.sqlite3"
 ZPLATIPLD_URL_DB = f"sqlite:///{RESULT_PATH}/{ZPLATIPLD_DB}"
+# Shared read-only handle, so each connect reuses the pooled engine instead
+# of building a new one to look up the private key
+KEY_VAULT_DB = CrudDB(ZPLATIPLD_URL_DB, readonly=True)
+
+# SFTP pipelining: keep up to SFTP_MAX_REQUESTS reads/writes of SFTP_BLOCK_SIZE
+# in flight per file instead of waiting a round trip for each block.
+SFTP_BLOCK_SIZE = 256 * 1024
+SFTP_MAX_REQUESTS = 64
 
 class RemoteSSHConnection:
     """A class for establishing and managing a remote SSH connection.
@@ -52,6 +65,15 @@ class RemoteSSHConnection:
         self.username = username
         self._conn = None
 
+    async def __aenter__(self) -> "RemoteSSHConnection":
+        """Opens the SSH connection shared by the calls made inside the block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Closes the shared SSH connection."""
+        await self.close()
+
     async def check_pkey(self) -> str:
         """Checks if the private key exists locally, and if not, retrieves it
         from the database and saves it to a file.
@@ -64,8 +86,9 @@ class RemoteSSHConnection:
 
         """
         private_file_path = "/zplatipld/secret"
-        key_vault_database = CrudDB(ZPLATIPLD_URL_DB)
+        key_vault_database = KEY_VAULT_DB
         keys_from_db = key_vault_database.read(Vault,condition={"username": self.username})
+        key_vault_database.remove()
         print(keys_from_db[0])
         private_key_from_db = re.sub(r"\r(?!\$)", "", keys_from_db[0].private_key)
 
@@ -122,9 +145,9 @@ class RemoteSSHConnection:
     async def run_command(self, command: str) -> str:
         """Runs the specified command on the remote host and returns its output as a string.
 
-        This method establishes an SSH connection to the remote host, runs the specified 
-        command using the connection object, retrieves the output of the command, closes 
-        the connection, and returns the output as a string. If there is an error
+        This method runs the specified command over the shared connection when one is
+        open, otherwise it establishes an SSH connection to the remote host, runs the
+        command, and closes the connection again. It returns the output as a string. If there is an error
         running the command or establishing the SSH connection, an exception is raised.
 
         Args:
@@ -138,19 +161,21 @@ class RemoteSSHConnection:
             running the command.
 
         """
-        conn = await self.connect()
-        result = await conn.run(command)
-        output = result.stdout.strip()
-        await self.close()
-        return output
+        owns_conn = self._conn is None
+        conn = self._conn or await self.connect()
+        try:
+            result = await conn.run(command)
+        finally:
+            if owns_conn:
+                await self.close()
+        return result.stdout.strip()
 
     async def upload_file(self, local_path: str, remote_path: str) -> None:
         """Uploads a file from the local machine to the remote host.
 
-        This method establishes an SSH connection to the remote host, uses 
-        the connection object to upload a file from the local machine to 
-        the remote host using the asyncssh.scp() method, and closes 
-        the connection. If there is an error uploading the file or establishing
+        This method uses the shared connection when one is open (otherwise a
+        one-shot connection) to upload a file from the local machine to
+        the remote host over SFTP with pipelined write requests. If there is an error uploading the file or establishing
         the SSH connection, an exception is raised.
 
         Args:
@@ -162,16 +187,27 @@ class RemoteSSHConnection:
             uploading the file.
 
         """
-        conn = await self.connect()
-        await asyncssh.scp(local_path, (conn, f"{remote_path}"))
-        await self.close()
+        owns_conn = self._conn is None
+        conn = self._conn or await self.connect()
+        try:
+            async with conn.start_sftp_client() as sftp:
+                await sftp.put(
+                    local_path,
+                    remote_path,
+                    block_size=SFTP_BLOCK_SIZE,
+                    max_requests=SFTP_MAX_REQUESTS,
+                )
+        finally:
+            if owns_conn:
+                await self.close()
 
     async def download_file(self, remote_path: str, local_path: str) -> None:
         """Downloads a file from the remote host to the local machine.
 
-        This method establishes an SSH connection to the remote host, uses the connection object
-        to download a file from the remote host to the local machine using the asyncssh.scp() 
-        method, and closes the connection. If there is an error downloading the file or 
+        This method uses the shared connection when one is open (otherwise a one-shot
+        connection) to download a file from the remote host to the local machine over
+        SFTP with pipelined read requests. Glob patterns such as "*.CSV" are expanded
+        on the remote side. If there is an error downloading the file or 
         establishing the SSH connection, an exception is raised.
 
         Args:
@@ -183,6 +219,16 @@ class RemoteSSHConnection:
             downloading the file.
 
         """
-        conn = await self.connect()
-        await asyncssh.scp((conn, f"{remote_path}"), local_path)
-        await self.close()
+        owns_conn = self._conn is None
+        conn = self._conn or await self.connect()
+        try:
+            async with conn.start_sftp_client() as sftp:
+                await sftp.mget(
+                    remote_path,
+                    local_path,
+                    block_size=SFTP_BLOCK_SIZE,
+                    max_requests=SFTP_MAX_REQUESTS,
+                )
+        finally:
+            if owns_conn:
+                await self.close()
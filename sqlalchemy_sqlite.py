@@ -1,25 +1,60 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, and_
-from sqlalchemy.orm import sessionmaker, declarative_base, load_only
+import logging
+from contextlib import contextmanager
+
+from sqlalchemy import (
+    create_engine,
+    event,
+    exc,
+    func,
+    insert,
+    select,
+    update,
+    Column,
+    Integer,
+    String,
+    Text,
+    and_,
+)
+from sqlalchemy.orm import (
+    sessionmaker,
+    scoped_session,
+    declarative_base,
+    load_only,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import text, column
 
 Base = declarative_base()
+logger = logging.getLogger(__name__)
+
+SQLITE_WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+# Compiled SQL cache entries per engine; every read is a select() with bound
+# parameters, so repeated queries skip compilation
+QUERY_CACHE_SIZE = 1200
 
 
 class Lpar(Base):
     __tablename__ = "lpar"
     id = Column(Integer, primary_key=True)
     lpar = Column(String)
-    hostname = Column(String)
+    hostname = Column(String, unique=True, index=True)
     dataset = Column(String)
     username = Column(String)
-    enable = Column(Integer)
+    enable = Column(Integer, index=True)
     schedule = Column(String)
 
 
 class Users(Base):
     __tablename__ = "user"
     id = Column(Integer, primary_key=True)
-    username = Column(String)
+    username = Column(String, unique=True, index=True)
     password = Column(String)
     name = Column(String)
     last_name = Column(String)
@@ -29,7 +64,7 @@ class Users(Base):
 class Vault(Base):
     __tablename__ = "vault"
     id = Column(Integer, primary_key=True)
-    username = Column(String)
+    username = Column(String, index=True)
     private_key = Column(Text)
     public_key = Column(Text)
 
@@ -87,11 +122,125 @@ class ResultsLastIplTable(Base):
 
 
 class CrudDB:
-    def __init__(self, db_url) -> None:
-        self.engine = create_engine(db_url)
-        Base.metadata.create_all(self.engine)
-        session_obj = sessionmaker(bind=self.engine)
-        self.session = session_obj()
+    def __init__(
+        self,
+        db_url,
+        readonly=False,
+        pool_size=5,
+        max_overflow=5,
+        txlock=None,
+    ) -> None:
+        self.readonly = readonly
+        self.txlock = txlock
+        if readonly and db_url.startswith("sqlite:///"):
+            db_url = (
+                f"sqlite:///file:{db_url[len('sqlite:///'):]}"
+                "?mode=ro&uri=true"
+            )
+        # One engine (and connection pool) per CrudDB, built once and reused
+        # by every request; handles are meant to be long-lived module globals
+        self.engine = create_engine(
+            db_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", self._set_sqlite_pragmas)
+            if txlock:
+                event.listen(self.engine, "begin", self._begin_with_txlock)
+        if not readonly:
+            Base.metadata.create_all(self.engine)
+            self._create_missing_indexes()
+        # One session per thread, all of them sharing the engine pool
+        self.session = scoped_session(sessionmaker(bind=self.engine))
+
+    def _set_sqlite_pragmas(self, dbapi_connection, connection_record):
+        if self.txlock:
+            # Let the "begin" listener emit BEGIN instead of pysqlite
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        if not self.readonly:
+            cursor.execute(SQLITE_WAL_PRAGMA)
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    def _create_missing_indexes(self):
+        # create_all only builds indexes together with new tables, so
+        # indexes added to existing tables are created here
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except exc.IntegrityError:
+                    # Rows from before the unique index share a value
+                    self._rename_duplicates(table, index)
+                    index.create(self.engine, checkfirst=True)
+
+    def _rename_duplicates(self, table, index):
+        # The oldest row keeps the value, later ones get "<value>~dup<id>":
+        # nothing is deleted and the unique index can be built
+        (unique_column,) = index.columns
+        duplicated = (
+            select(unique_column)
+            .group_by(unique_column)
+            .having(func.count() > 1)
+        )
+        with self.engine.begin() as connection:
+            rows = connection.execute(
+                select(table.c.id, unique_column)
+                .where(unique_column.in_(duplicated))
+                .order_by(unique_column, table.c.id)
+            ).all()
+            kept = set()
+            for row_id, value in rows:
+                if value not in kept:
+                    kept.add(value)
+                    continue
+                new_value = f"{value}~dup{row_id}"
+                connection.execute(
+                    update(table)
+                    .where(table.c.id == row_id)
+                    .values({unique_column.name: new_value})
+                )
+                logger.warning(
+                    "Duplicate %s.%s %r: row %s renamed to %r",
+                    table.name,
+                    unique_column.name,
+                    value,
+                    row_id,
+                    new_value,
+                )
+
+    def _begin_with_txlock(self, connection):
+        connection.exec_driver_sql(f"BEGIN {self.txlock}")
+
+    def remove(self):
+        self.session.remove()
+
+    @contextmanager
+    def transaction(self):
+        # Batch writes: create/update/delete only flush inside the block and
+        # a single commit (one BEGIN ... COMMIT, one fsync) happens at exit
+        session = self.session()
+        session.info["batch"] = True
+        try:
+            yield self
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.info.pop("batch", None)
+
+    def _commit(self):
+        if self.session.info.get("batch"):
+            self.session.flush()
+        else:
+            self.session.commit()
 
     def init_database(self):
         Base.metadata.create_all(self.engine)
@@ -111,15 +260,40 @@ class CrudDB:
     def create(self, table, data):
         record = table(**data)
         self.session.add(record)
-        self.session.commit()
+        self._commit()
         return record
 
+    def create_many(self, table, rows):
+        # One executemany INSERT for all rows, committed once
+        if not rows:
+            return 0
+        try:
+            self.session.execute(insert(table), rows)
+            self._commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return len(rows)
+
+    def create_if_absent(self, table, data, unique_columns):
+        # INSERT ... ON CONFLICT DO NOTHING: the existence check and the
+        # insert are one atomic statement, backed by a unique index
+        statement = (
+            sqlite_insert(table)
+            .values(**data)
+            .on_conflict_do_nothing(index_elements=unique_columns)
+        )
+        result = self.session.execute(statement)
+        self._commit()
+        return result.rowcount > 0
+
     def read(self, table, distinct=None, condition=None, in_values=None):
         if distinct:
             return (
-                self.session.query(table)
-                .distinct()
-                .group_by(text(distinct))
+                self.session.execute(
+                    select(table).distinct().group_by(text(distinct))
+                )
+                .scalars()
                 .all()
             )
         elif distinct and condition:
@@ -132,28 +306,63 @@ class CrudDB:
                 for field, value in condition.items()
             ]
             return (
-                self.session.query(table).filter(and_(*filter_conditions)).all()
+                self.session.execute(
+                    select(table).where(and_(*filter_conditions))
+                )
+                .scalars()
+                .all()
             )
         elif in_values:
             for field, values in in_values.items():
                 filter_condition = getattr(table, field).in_(values)
-            return self.session.query(table).filter(filter_condition).all()
+            return (
+                self.session.execute(select(table).where(filter_condition))
+                .scalars()
+                .all()
+            )
         else:
-            return self.session.query(table).all()
+            return self.session.execute(select(table)).scalars().all()
+
+    def read_columns(self, columns, distinct=False, batch_size=None):
+        # Plain RowMappings (dict-like) of just these columns, no ORM objects.
+        # With batch_size the rows are fetched lazily, batch_size at a time.
+        statement = select(*columns)
+        if distinct:
+            statement = statement.distinct()
+        if batch_size:
+            return self.session.execute(
+                statement, execution_options={"yield_per": batch_size}
+            ).mappings()
+        return self.session.execute(statement).mappings().all()
 
     def update(self, table, record_id, data):
         record = self.read(table, condition=record_id)
         if record:
             for key, value in data.items():
                 setattr(record[0], key, value)
-            self.session.commit()
+            self._commit()
             return record[0]
         return None
 
+    def update_values(self, table, record_id, data):
+        # Single UPDATE ... WHERE, without loading the row first
+        filter_conditions = [
+            getattr(table, field) == value for field, value in record_id.items()
+        ]
+        try:
+            result = self.session.execute(
+                update(table).where(and_(*filter_conditions)).values(**data)
+            )
+            self._commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return result.rowcount
+
     def delete(self, table, record_id):
         record = self.read(table, f"id={record_id}")
         if record:
             self.session.delete(record)
-            self.session.commit()
+            self._commit()
             return True
         return False